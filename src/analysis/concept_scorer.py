@@ -2,12 +2,24 @@ from __future__ import annotations
 
 import json
 
+import numpy as np
+
 from discussion.llm_client import MockLLMClient
 from discussion.models import DiscussionTranscript, MessageRole
 
 from .models import ConceptScores
 from .prompts import CONCEPT_SCORE_BATCH_PROMPT, CONCEPT_SCORE_PROMPT
 
+_METRICS = (
+    "purchase_intent",
+    "overall_appeal",
+    "uniqueness",
+    "relevance",
+    "believability",
+    "value_perception",
+)
+_EXCITEMENT_WEIGHTS = {"overall_appeal": 0.3, "uniqueness": 0.25, "purchase_intent": 0.25, "relevance": 0.2}
+
 
 class ConceptScorer:
     def __init__(self, llm_client):
@@ -37,24 +49,9 @@ class ConceptScorer:
                         scores = self._mock_scores_for_persona(persona)
                     per_participant[persona.id] = scores
 
-        aggregate = {
-            metric: self._top2box(per_participant, metric)
-            for metric in [
-                "purchase_intent",
-                "overall_appeal",
-                "uniqueness",
-                "relevance",
-                "believability",
-                "value_perception",
-            ]
-        }
+        aggregate = dict(zip(_METRICS, self._top2box(per_participant).tolist()))
 
-        excitement = (
-            aggregate["overall_appeal"] * 0.3
-            + aggregate["uniqueness"] * 0.25
-            + aggregate["purchase_intent"] * 0.25
-            + aggregate["relevance"] * 0.2
-        )
+        excitement = sum(aggregate[metric] * weight for metric, weight in _EXCITEMENT_WEIGHTS.items())
 
         return ConceptScores(
             purchase_intent=aggregate["purchase_intent"],
@@ -173,14 +170,18 @@ class ConceptScorer:
         }
 
     @staticmethod
-    def _top2box(participant_scores: dict[str, dict[str, float]], metric: str) -> float:
+    def _top2box(participant_scores: dict[str, dict[str, float]]) -> np.ndarray:
+        """Top-2-box share per metric from a (participants, metrics) matrix; missing scores are skipped."""
         if not participant_scores:
-            return 0.0
-        values = [scores[metric] for scores in participant_scores.values() if metric in scores]
-        if not values:
-            return 0.0
-        top_two = sum(1 for score in values if score >= 3.5)
-        return round(top_two / len(values), 4)
+            return np.zeros(len(_METRICS))
+        matrix = np.array(
+            [[scores.get(metric, np.nan) for metric in _METRICS] for scores in participant_scores.values()],
+            dtype=float,
+        )
+        answered = (~np.isnan(matrix)).sum(axis=0)
+        top_two = (matrix >= 3.5).sum(axis=0)
+        shares = np.divide(top_two, answered, out=np.zeros(len(_METRICS)), where=answered > 0)
+        return np.round(shares, 4)
 
     @staticmethod
     def _clamp(value: float, lo: float, hi: float) -> float:
@@ -9,6 +9,8 @@ from discussion.simulator import DiscussionSimulator
 from .models import ConsistencyReport, RunResult
 from .scorecard import QualityScorecard
 
+_CV_METRICS = ("purchase_intent", "overall_appeal", "uniqueness", "relevance", "believability", "value_perception", "excitement_score")
+
 
 class ConsistencyRunner:
     """Runs the same concept multiple times with different seeds to measure stability."""
@@ -73,9 +75,8 @@ class ConsistencyRunner:
 
     def _compute_score_cv(self, runs: list[RunResult]) -> dict[str, float]:
         """Coefficient of variation for each metric across runs."""
-        metrics = ["purchase_intent", "overall_appeal", "uniqueness", "relevance", "believability", "value_perception", "excitement_score"]
         cv_map: dict[str, float] = {}
-        for metric in metrics:
+        for metric in _CV_METRICS:
             values = [getattr(r.concept_scores, metric) for r in runs]
             mean = sum(values) / len(values) if values else 0
             if mean == 0:
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import math
 
+import numpy as np
+
 from analysis.models import AnalysisReport, ConceptScores
 from discussion.models import DiscussionTranscript, MessageRole
 
@@ -212,15 +214,12 @@ class QualityScorecard:
     @staticmethod
     def _pearson(pairs: list[tuple[float, float]]) -> float:
         """Compute Pearson correlation coefficient."""
-        n = len(pairs)
-        if n < 2:
+        if len(pairs) < 2:
             return 0.0
-        xs, ys = zip(*pairs)
-        mean_x = sum(xs) / n
-        mean_y = sum(ys) / n
-        cov = sum((x - mean_x) * (y - mean_y) for x, y in pairs) / n
-        std_x = math.sqrt(sum((x - mean_x) ** 2 for x in xs) / n)
-        std_y = math.sqrt(sum((y - mean_y) ** 2 for y in ys) / n)
-        if std_x == 0 or std_y == 0:
+        xs, ys = np.asarray(pairs, dtype=float).T
+        dx = xs - xs.mean()
+        dy = ys - ys.mean()
+        denom = math.sqrt(float(dx @ dx) * float(dy @ dy))
+        if denom == 0:
             return 0.0
-        return cov / (std_x * std_y)
+        return float(dx @ dy) / denom
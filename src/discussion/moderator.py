@@ -17,6 +17,8 @@ class Moderator:
         self._rng = random.Random(13)
         self._cumulative_speak_counts: dict[str, int] = {}
         self._recent_question_speakers: list[set[str]] = []  # last N questions' speaker sets
+        self._quiet_pool_key: tuple[tuple[str, float], ...] | None = None
+        self._quiet_pool_ids: set[str] = set()
 
     async def generate_discussion_guide(self) -> list[str]:
         guide: list[str] = []
@@ -109,11 +111,7 @@ class Moderator:
         use_pools = len(participants) > 12
         quiet_pool: set[str] = set()
         if use_pools:
-            sorted_by_ext = sorted(
-                participants, key=lambda p: p.persona.psychographics.ocean.extraversion
-            )
-            quiet_cutoff = int(len(sorted_by_ext) * 0.4)
-            quiet_pool = set(p.persona.id for p in sorted_by_ext[:quiet_cutoff])
+            quiet_pool = self.precompute_pool(participants)
             min_quiet = max(1, int(target * 0.3))
 
             quiet_chosen = sum(1 for p in chosen if p.persona.id in quiet_pool)
@@ -187,6 +185,20 @@ class Moderator:
 
         return result
 
+    def precompute_pool(self, participants: list[Participant]) -> set[str]:
+        """Return the ids of the least extraverted 40% of participants.
+
+        Cached on the roster and each participant's extraversion, so a changed
+        trait recomputes the pool.
+        """
+        key = tuple((p.persona.id, p.persona.psychographics.ocean.extraversion) for p in participants)
+        if key != self._quiet_pool_key:
+            sorted_by_ext = sorted(key, key=lambda item: item[1])
+            quiet_cutoff = int(len(sorted_by_ext) * 0.4)
+            self._quiet_pool_ids = set(pid for pid, _ in sorted_by_ext[:quiet_cutoff])
+            self._quiet_pool_key = key
+        return self._quiet_pool_ids
+
     @staticmethod
     def _summarize_recent(messages: list[DiscussionMessage]) -> str:
         if not messages:
@@ -116,15 +116,15 @@ class Participant:
         if question and self.persona.name.lower() in question.lower():
             return True
 
-        extraversion = self.persona.psychographics.ocean.extraversion
-        if extraversion >= 70:
-            threshold = 0.85
-        elif extraversion >= 40:
-            threshold = 0.60
-        else:
-            threshold = 0.35
+        return random.random() < self._speak_probability(self.persona.psychographics.ocean.extraversion)
 
-        return random.random() < threshold
+    @staticmethod
+    def _speak_probability(extraversion: float) -> float:
+        if extraversion >= 70:
+            return 0.85
+        if extraversion >= 40:
+            return 0.60
+        return 0.35
 
     async def _detect_opinion_shift(
         self, response_text: str, discussion_context: list[DiscussionMessage]
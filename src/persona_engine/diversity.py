@@ -16,6 +16,9 @@ class DiversityReport(BaseModel):
     issues: list[str]
 
 
+_TRAIT_NAMES = ("openness", "conscientiousness", "extraversion", "agreeableness", "neuroticism")
+
+
 def _sign_bucket(valence: float | None) -> str:
     if valence is None:
         return "none"
@@ -90,19 +93,25 @@ class DiversityChecker:
                 issues=["No personas provided"],
             )
 
-        openness = np.array([p.psychographics.ocean.openness for p in personas], dtype=float)
-        conscientiousness = np.array([p.psychographics.ocean.conscientiousness for p in personas], dtype=float)
-        extraversion = np.array([p.psychographics.ocean.extraversion for p in personas], dtype=float)
-        agreeableness = np.array([p.psychographics.ocean.agreeableness for p in personas], dtype=float)
-        neuroticism = np.array([p.psychographics.ocean.neuroticism for p in personas], dtype=float)
+        # Single pass over personas: trait columns (one contiguous row per trait),
+        # valences and genders are gathered together, then reduced with numpy.
+        traits = np.empty((len(_TRAIT_NAMES), len(personas)), dtype=float)
+        valences: list[float | None] = []
+        genders: list[str] = []
+        for idx, persona in enumerate(personas):
+            ocean = persona.psychographics.ocean
+            traits[:, idx] = (
+                ocean.openness,
+                ocean.conscientiousness,
+                ocean.extraversion,
+                ocean.agreeableness,
+                ocean.neuroticism,
+            )
+            valences.append(persona.opinion_valence)
+            genders.append(self._normalize_gender(persona.demographics.gender))
 
-        personality_spread = {
-            "openness": float(np.std(openness)),
-            "conscientiousness": float(np.std(conscientiousness)),
-            "extraversion": float(np.std(extraversion)),
-            "agreeableness": float(np.std(agreeableness)),
-            "neuroticism": float(np.std(neuroticism)),
-        }
+        openness, _, _, agreeableness, neuroticism = traits
+        personality_spread = dict(zip(_TRAIT_NAMES, traits.std(axis=1).tolist()))
 
         if target.require_contrarian and not np.any(agreeableness < 30):
             issues.append("Missing contrarian (agreeableness < 30)")
@@ -113,7 +122,7 @@ class DiversityChecker:
         if target.require_worrier and not np.any(neuroticism > 70):
             issues.append("Missing worrier (neuroticism > 70)")
 
-        opinion_entropy = _entropy([p.opinion_valence for p in personas])
+        opinion_entropy = _entropy(valences)
         if opinion_entropy < target.min_opinion_entropy:
             issues.append(f"Opinion entropy too low ({opinion_entropy:.2f} < {target.min_opinion_entropy})")
 
@@ -121,11 +130,11 @@ class DiversityChecker:
             if spread < target.min_trait_std:
                 issues.append(f"Trait spread too low for {trait} ({spread:.2f} < {target.min_trait_std})")
 
-        signs = Counter(_sign_bucket(p.opinion_valence) for p in personas)
+        signs = Counter(_sign_bucket(v) for v in valences)
         if max(signs.get("positive", 0), signs.get("negative", 0)) > target.max_same_sign:
             issues.append("Too many personas share the same opinion sign")
 
-        gender_counts = Counter(self._normalize_gender(p.demographics.gender) for p in personas)
+        gender_counts = Counter(genders)
         if len(personas) >= 2 and len(gender_counts) < 2:
             issues.append("Gender diversity too low (need at least two genders)")
         majority_gender, majority_count = gender_counts.most_common(1)[0]
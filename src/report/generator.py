@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import hashlib
+import os
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import BaseLoader, Environment, FileSystemLoader, ModuleLoader, select_autoescape
 
 from analysis.models import AnalysisReport
 from discussion.models import DiscussionTranscript, MessageRole
@@ -12,20 +15,94 @@ from discussion.models import DiscussionTranscript, MessageRole
 from .charts import PALETTE, ChartGenerator
 
 if TYPE_CHECKING:
+    from jinja2.environment import TemplateStream
+
     from consistency.models import ScorecardResult
 
+TEMPLATES_DIR = Path(__file__).resolve().parent / "templates"
+# Optional directory of templates precompiled by compile_templates; without one
+# (the default) the report is rendered straight from TEMPLATES_DIR.
+COMPILED_TEMPLATES_ENV = "SFG_COMPILED_TEMPLATES_DIR"
+# Written next to the compiled modules; records which template sources they were built from.
+_SOURCE_DIGEST_FILE = "SOURCE_DIGEST"
+
+_WRITE_BUFFER_SIZE = 256 * 1024
+_RECOMMENDATION_PREFIXES = {"GO": "GO", "IT": "ITERATE", "NO": "NO-GO"}
+
+
+def _templates_digest() -> str:
+    """Hash of every template source, used to detect stale compiled templates."""
+    digest = hashlib.sha256()
+    for path in sorted(TEMPLATES_DIR.rglob("*")):
+        if path.is_file():
+            digest.update(path.relative_to(TEMPLATES_DIR).as_posix().encode())
+            digest.update(b"\0")
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _compiled_templates_current(compiled_dir: Path) -> bool:
+    try:
+        recorded = (compiled_dir / _SOURCE_DIGEST_FILE).read_text().strip()
+    except OSError:
+        return False
+    return recorded == _templates_digest()
+
+
+@lru_cache(maxsize=16)
+def _pretty_phase(phase_value: str) -> str:
+    return phase_value.replace("_", " ").title()
+
 
 class ReportGenerator:
-    def __init__(self):
+    def __init__(self, compiled_templates_dir: str | Path | None = None):
         self.chart_gen = ChartGenerator()
-        templates_dir = Path(__file__).resolve().parent / "templates"
-        self.env = Environment(
-            loader=FileSystemLoader(str(templates_dir)),
+        if compiled_templates_dir is None:
+            compiled_templates_dir = os.environ.get(COMPILED_TEMPLATES_ENV) or None
+        compiled_dir = Path(compiled_templates_dir).resolve() if compiled_templates_dir is not None else None
+        self.env = self._environment_for(compiled_dir)
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _environment_for(compiled_dir: Path | None) -> Environment:
+        """Shared environment per template source, so each template is loaded and compiled once per process."""
+        # Prefer templates precompiled to Python modules (see compile_templates), but
+        # only while they match the sources; otherwise parse the sources directly.
+        if compiled_dir is not None and _compiled_templates_current(compiled_dir):
+            loader: BaseLoader = ModuleLoader(str(compiled_dir))
+        else:
+            loader = FileSystemLoader(str(TEMPLATES_DIR))
+        return ReportGenerator._build_environment(loader)
+
+    @staticmethod
+    def _build_environment(loader: BaseLoader) -> Environment:
+        # Templates ship with the package and never change at runtime: keep every
+        # loaded template and skip the per-lookup mtime check.
+        return Environment(
+            loader=loader,
             autoescape=select_autoescape(["html", "xml"]),
             trim_blocks=True,
             lstrip_blocks=True,
+            auto_reload=False,
+            cache_size=-1,
         )
 
+    @classmethod
+    def compile_templates(cls, target: str | Path) -> str:
+        """Compile the report templates into importable modules for ModuleLoader.
+
+        Pass the returned directory to ReportGenerator, or set it in
+        SFG_COMPILED_TEMPLATES_DIR, to render from the compiled modules.
+        """
+        env = cls._build_environment(FileSystemLoader(str(TEMPLATES_DIR)))
+        target_path = Path(target)
+        target_path.mkdir(parents=True, exist_ok=True)
+        env.compile_templates(str(target_path), zip=None)
+        (target_path / _SOURCE_DIGEST_FILE).write_text(_templates_digest())
+        # An environment cached before compilation would still use the source loader.
+        cls._environment_for.cache_clear()
+        return str(target_path)
+
     def generate_html(
         self,
         report: AnalysisReport,
@@ -34,10 +111,34 @@ class ReportGenerator:
         include_transcript: bool = True,
         scorecard: ScorecardResult | None = None,
     ) -> str:
-        context = self._prepare_context(report=report, transcript=transcript, personas=personas, scorecard=scorecard)
-        context["include_transcript"] = include_transcript
+        context = self._prepare_context(
+            report=report,
+            transcript=transcript,
+            personas=personas,
+            include_transcript=include_transcript,
+            scorecard=scorecard,
+        )
+        # render() joins the template's chunk generator in one pass, skipping TemplateStream's buffering layer.
+        return self.env.get_template("report.html").render(**context)
+
+    def stream_html(
+        self,
+        report: AnalysisReport,
+        transcript: DiscussionTranscript,
+        personas: list,
+        include_transcript: bool = True,
+        scorecard: ScorecardResult | None = None,
+    ) -> TemplateStream:
+        """Render the report lazily, yielding HTML in chunks instead of one large string."""
+        context = self._prepare_context(
+            report=report,
+            transcript=transcript,
+            personas=personas,
+            include_transcript=include_transcript,
+            scorecard=scorecard,
+        )
         template = self.env.get_template("report.html")
-        return template.render(**context)
+        return template.stream(**context)
 
     def save_html(
         self,
@@ -48,7 +149,7 @@ class ReportGenerator:
         include_transcript: bool = True,
         scorecard: ScorecardResult | None = None,
     ) -> str:
-        html = self.generate_html(
+        stream = self.stream_html(
             report=report,
             transcript=transcript,
             personas=personas,
@@ -57,7 +158,8 @@ class ReportGenerator:
         )
         target = Path(output_path)
         target.parent.mkdir(parents=True, exist_ok=True)
-        target.write_text(html, encoding="utf-8")
+        with target.open("w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as handle:
+            stream.dump(handle)
         return str(target)
 
     def _prepare_context(
@@ -65,6 +167,7 @@ class ReportGenerator:
         report: AnalysisReport,
         transcript: DiscussionTranscript,
         personas: list,
+        include_transcript: bool = True,
         scorecard: ScorecardResult | None = None,
     ) -> dict:
         participant_count = len(personas)
@@ -99,19 +202,19 @@ class ReportGenerator:
             for name, score in metrics
         ]
 
-        phases = list(report.sentiment_timeline.by_phase.keys())
-        sentiment_values = list(report.sentiment_timeline.by_phase.values())
+        by_phase = report.sentiment_timeline.by_phase
+        phases, sentiment_values = map(list, zip(*by_phase.items())) if by_phase else ([], [])
         sentiment_rows = [
             {
-                "phase": phase.replace("_", " ").title(),
+                "phase": _pretty_phase(phase),
                 "score": score,
                 "label": self._sentiment_label(score),
                 "summary": self._sentiment_summary(phase, score),
             }
-            for phase, score in zip(phases, sentiment_values)
+            for phase, score in by_phase.items()
         ]
 
-        quote_speaker_lookup = self._quote_speaker_map(transcript)
+        quote_speaker_lookup, final_valence_map, transcript_rows = self._scan_transcript(transcript, include_transcript)
         used_quotes: set[str] = set()
         theme_rows = []
         for theme in report.themes:
@@ -137,7 +240,6 @@ class ReportGenerator:
             )
 
         participant_rows = []
-        final_valence_map = self._final_opinion_map(transcript)
         for persona in personas:
             income_value = getattr(persona.demographics, "income", 0)
             participant_rows.append(
@@ -170,20 +272,6 @@ class ReportGenerator:
             "most_impactful": report.quotes.most_impactful[:5],
         }
 
-        transcript_rows = []
-        current_phase = None
-        for message in transcript.messages:
-            phase_label = message.phase.value.replace("_", " ").title()
-            row = {
-                "is_phase": current_phase != message.phase.value,
-                "phase": phase_label,
-                "speaker": message.speaker_name,
-                "content": message.content,
-                "role": message.role.value,
-            }
-            transcript_rows.append(row)
-            current_phase = message.phase.value
-
         recommendation_chart = self.chart_gen.donut_chart(
             labels=[rec_label, "Remaining"],
             values=[report.concept_scores.excitement_score, 1 - report.concept_scores.excitement_score],
@@ -191,11 +279,13 @@ class ReportGenerator:
             colors=[rec_color, "#E5E7EB"],
         )
 
+        top_themes = theme_rows[:7]
         theme_prevalence_chart = self.chart_gen.horizontal_bar_chart(
-            labels=[theme["name"] for theme in theme_rows[:7]],
-            values=[theme["prevalence"] for theme in theme_rows[:7]],
+            labels=[theme["name"] for theme in top_themes],
+            values=[theme["prevalence"] for theme in top_themes],
             title="Theme Prevalence",
         )
+        metric_names, metric_scores = zip(*metrics)
 
         return {
             "product_concept": concept,
@@ -219,8 +309,8 @@ class ReportGenerator:
                 height=120,
             ),
             "concept_chart": self.chart_gen.horizontal_bar_chart(
-                labels=[name for name, _ in metrics],
-                values=[score for _, score in metrics],
+                labels=list(metric_names),
+                values=list(metric_scores),
                 title="Top-2-Box Concept Scores",
             ),
             "metric_rows": metric_rows,
@@ -242,6 +332,7 @@ class ReportGenerator:
             "phase_count": phase_count,
             "message_count": len(transcript.messages),
             "participant_count": participant_count,
+            "include_transcript": include_transcript,
             "transcript_rows": transcript_rows,
             "methodology_points": [
                 "This study used AI-generated personas grounded in US Census demographic data.",
@@ -323,14 +414,12 @@ class ReportGenerator:
         return "Mixed"
 
     @staticmethod
+    @lru_cache(maxsize=32)
     def _recommendation_label(recommendation: str) -> str:
         upper = recommendation.upper()
-        if upper.startswith("GO"):
-            return "GO"
-        if upper.startswith("ITERATE"):
-            return "ITERATE"
-        if upper.startswith("NO-GO"):
-            return "NO-GO"
+        label = _RECOMMENDATION_PREFIXES.get(upper[:2])
+        if label is not None and upper.startswith(label):
+            return label
         return "ITERATE"
 
     @staticmethod
@@ -353,20 +442,31 @@ class ReportGenerator:
         return f"In {phase_label}, {tone} (sentiment {score:+.2f})."
 
     @staticmethod
-    def _quote_speaker_map(transcript: DiscussionTranscript) -> dict[str, str]:
-        out: dict[str, str] = {}
-        for message in transcript.messages:
-            if message.role == MessageRole.PARTICIPANT:
-                out[message.content] = message.speaker_name
-        return out
-
-    @staticmethod
-    def _final_opinion_map(transcript: DiscussionTranscript) -> dict[str, float | None]:
-        out: dict[str, float | None] = {}
+    def _scan_transcript(
+        transcript: DiscussionTranscript,
+        include_transcript: bool,
+    ) -> tuple[dict[str, str], dict[str, float | None], list[dict]]:
+        """Collect quote speakers, final valences and (optionally) transcript rows in one pass."""
+        quote_speakers: dict[str, str] = {}
+        final_valences: dict[str, float | None] = {}
+        transcript_rows: list[dict] = []
+        current_phase = None
         for message in transcript.messages:
             if message.role == MessageRole.PARTICIPANT:
-                out[message.speaker_id] = message.sentiment
-        return out
+                quote_speakers[message.content] = message.speaker_name
+                final_valences[message.speaker_id] = message.sentiment
+            if include_transcript:
+                transcript_rows.append(
+                    {
+                        "is_phase": current_phase != message.phase.value,
+                        "phase": _pretty_phase(message.phase.value),
+                        "speaker": message.speaker_name,
+                        "content": message.content,
+                        "role": message.role.value,
+                    }
+                )
+                current_phase = message.phase.value
+        return quote_speakers, final_valences, transcript_rows
 
     @staticmethod
     def _opinion_text(value: float | None) -> str:
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from discussion.llm_client import MockLLMClient
+
+
+class CachedMockLLMClient(MockLLMClient):
+    """MockLLMClient that memoizes completions per (system_prompt, user_prompt).
+
+    The base mock is a pure function of the prompts, so replaying a cached answer
+    is indistinguishable from recomputing it.
+    """
+
+    def __init__(self, model: str = "mock/model", **kwargs):
+        super().__init__(model=model, **kwargs)
+        self._cache: dict[tuple[str, str], str] = {}
+
+    async def complete(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.9,
+        max_tokens: int = 300,
+    ) -> str:
+        key = (system_prompt, user_prompt)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        result = await super().complete(system_prompt, user_prompt, temperature, max_tokens)
+        self._cache[key] = result
+        return result
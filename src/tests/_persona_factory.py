@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from persona_engine.models import (
+    ConsumerProfile,
+    Demographics,
+    Location,
+    OceanScores,
+    Persona,
+    Psychographics,
+    SchwartzValues,
+    VoiceProfile,
+)
+
+
+def _persona(idx: int, extraversion: float = 60.0) -> Persona:
+    name = f"Person{idx}"
+    return Persona(
+        id=f"pid-{idx}",
+        name=name,
+        demographics=Demographics(
+            age=25 + idx,
+            gender="male" if idx % 2 == 0 else "female",
+            income=50000 + (idx * 5000),
+            education="bachelor",
+            occupation="analyst",
+            location=Location(state="TX", metro_area="Austin", urbanicity="urban"),
+            household_type="single",
+            race_ethnicity="mixed",
+        ),
+        psychographics=Psychographics(
+            ocean=OceanScores(
+                openness=55,
+                conscientiousness=60,
+                extraversion=extraversion,
+                agreeableness=55,
+                neuroticism=45,
+            ),
+            vals_type="Achiever",
+            schwartz_values=SchwartzValues(primary="achievement", secondary="security"),
+        ),
+        consumer=ConsumerProfile(
+            price_sensitivity=0.5,
+            brand_loyalty=0.4,
+            research_tendency=0.5,
+            impulse_tendency=0.5,
+            social_influence=0.5,
+            risk_tolerance=0.5,
+            category_engagement="medium",
+            decision_style="balanced",
+        ),
+        voice=VoiceProfile(
+            vocabulary_level="medium",
+            verbosity="medium",
+            hedging_tendency=0.4,
+            emotional_expressiveness=0.4,
+            assertiveness=0.5,
+            humor_tendency=0.3,
+            communication_style="conversational",
+        ),
+        initial_opinion="Neutral",
+        opinion_valence=0.0,
+    )
+
+
+_TEMPLATE = _persona(0)
+
+
+def fast_persona(idx: int, extraversion: float = 60.0) -> Persona:
+    """Equivalent to ``_persona(idx, extraversion)`` without re-validating the model graph.
+
+    Only the idx/extraversion-dependent models are copied; location, consumer, voice and
+    Schwartz values are shared with the template and must be treated as read-only.
+    """
+    template = _TEMPLATE
+    demographics = template.demographics.model_copy(
+        update={
+            "age": 25 + idx,
+            "gender": "male" if idx % 2 == 0 else "female",
+            "income": 50000 + (idx * 5000),
+        }
+    )
+    psychographics = template.psychographics.model_copy(
+        update={"ocean": template.psychographics.ocean.model_copy(update={"extraversion": extraversion})}
+    )
+    return template.model_copy(
+        update={
+            "id": f"pid-{idx}",
+            "name": f"Person{idx}",
+            "demographics": demographics,
+            "psychographics": psychographics,
+        }
+    )
+
+
+def make_persona(
+    idx: int,
+    age: int,
+    income: int,
+    gender: str,
+    openness: float,
+    agreeableness: float,
+    vals_type: str,
+    valence: float,
+) -> Persona:
+    """Persona for analyzer tests, varying only the fields segmentation and theming read.
+
+    Built from the shared template like ``fast_persona``; nested models that are not
+    replaced are shared and must be treated as read-only.
+    """
+    template = _TEMPLATE
+    demographics = template.demographics.model_copy(update={"age": age, "income": income, "gender": gender})
+    psychographics = template.psychographics.model_copy(
+        update={
+            "ocean": template.psychographics.ocean.model_copy(
+                update={"openness": openness, "agreeableness": agreeableness}
+            ),
+            "vals_type": vals_type,
+        }
+    )
+    return template.model_copy(
+        update={
+            "id": f"p{idx}",
+            "name": f"Person {idx}",
+            "demographics": demographics,
+            "psychographics": psychographics,
+            "opinion_valence": valence,
+        }
+    )
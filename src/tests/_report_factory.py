@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from analysis.models import AnalysisReport, ConceptScores, QuoteCollection, SentimentTimeline, Theme
+from discussion.models import DiscussionConfig, DiscussionMessage, DiscussionTranscript
+
+
+def make_concept_scores(participant_scores: dict[str, dict[str, float]] | None = None) -> ConceptScores:
+    """Create a ConceptScores object with optional participant scores."""
+    return ConceptScores(
+        purchase_intent=0.65,
+        overall_appeal=0.70,
+        uniqueness=0.55,
+        relevance=0.60,
+        believability=0.58,
+        value_perception=0.62,
+        excitement_score=0.60,
+        participant_scores={pid: dict(scores) for pid, scores in (participant_scores or {}).items()},
+    )
+
+
+def make_analysis_report(participant_scores: dict[str, dict[str, float]] | None = None) -> AnalysisReport:
+    """Create a minimal AnalysisReport for testing."""
+    return AnalysisReport(
+        executive_summary="Test summary",
+        recommendation="GO",
+        confidence_level="High",
+        concept_scores=make_concept_scores(participant_scores),
+        themes=[
+            Theme(
+                name="Test Theme",
+                description="A test theme",
+                prevalence=0.5,
+                sentiment=0.3,
+                supporting_quotes=["quote1"],
+                participant_ids=["p1"],
+                phase_distribution={"warmup": 1},
+            )
+        ],
+        sentiment_timeline=SentimentTimeline(
+            by_phase={"warmup": 0.2, "exploration": 0.3},
+            by_turn=[0.1, 0.2, 0.3],
+            overall=0.25,
+            trend="positive",
+        ),
+        quotes=QuoteCollection(positive=[], negative=[], surprising=[], most_impactful=[]),
+        segment_insights=[],
+        top_concerns=["concern1"],
+        top_opportunities=["opportunity1"],
+        suggested_improvements=["improvement1"],
+        num_participants=4,
+        num_messages=20,
+        phases_completed=["warmup", "exploration"],
+    )
+
+
+def make_transcript(messages: list[DiscussionMessage] | None = None) -> DiscussionTranscript:
+    """Create a minimal DiscussionTranscript for testing."""
+    config = DiscussionConfig(
+        product_concept="Test Product",
+        category="test",
+        num_personas=4,
+    )
+    return DiscussionTranscript(
+        config=config,
+        messages=list(messages or []),
+        personas=[],
+    )
@@ -1,9 +1,64 @@
 from __future__ import annotations
 
+import asyncio
+import copy
+import functools
 import sys
+from collections.abc import Callable
 from pathlib import Path
 
+import pytest
+
+try:
+    import uvloop
+except ImportError:  # optional; the stdlib loop is used when unavailable
+    uvloop = None
+
 ROOT = Path(__file__).resolve().parents[2]
 SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
+
+from persona_engine.generator import PersonaGenerator  # noqa: E402
+from persona_engine.models import Persona  # noqa: E402
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_generate(
+    seed: int,
+    n: int,
+    product_concept: str | None = None,
+    category: str | None = None,
+) -> tuple[Persona, ...]:
+    personas = PersonaGenerator(seed=seed).generate(n=n, product_concept=product_concept, category=category)
+    return tuple(personas)
+
+
+@pytest.fixture(scope="session")
+def generate_personas() -> Callable[..., list[Persona]]:
+    """Deterministic persona generation memoized on (seed, n, product_concept, category).
+
+    Pass ``mutable=True`` when the test modifies the personas; it receives deep copies
+    so the cached pool stays pristine.
+    """
+
+    def _generate(
+        seed: int,
+        n: int,
+        product_concept: str | None = None,
+        category: str | None = None,
+        *,
+        mutable: bool = False,
+    ) -> list[Persona]:
+        personas = _cached_generate(seed, n, product_concept, category)
+        return copy.deepcopy(list(personas)) if mutable else list(personas)
+
+    return _generate
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_asyncio_loop_factories(config: pytest.Config, item: pytest.Item) -> dict[str, Callable[[], asyncio.AbstractEventLoop]]:
+    """Drive the shared session loop with uvloop when it is installed."""
+    if uvloop is not None:
+        return {"uvloop": uvloop.new_event_loop}
+    return {"asyncio": asyncio.new_event_loop}
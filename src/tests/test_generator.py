@@ -5,6 +5,18 @@ from collections import Counter
 from persona_engine.diversity import DiversityChecker
 from persona_engine.generator import PersonaGenerator
 
+_TECH_OCCUPATIONS = frozenset(
+    {
+        "software engineer",
+        "data scientist",
+        "product manager",
+        "engineering manager",
+        "principal engineer",
+        "business analyst",
+        "technician",
+    }
+)
+
 
 def test_generate_8_personas_diversity_passes() -> None:
     generator = PersonaGenerator(seed=42)
@@ -46,34 +58,24 @@ def test_generate_with_tight_constraints() -> None:
     assert len(personas) == 8
     assert all(p.demographics.gender == "female" for p in personas)
     assert all(25 <= p.demographics.age <= 35 for p in personas)
-    assert all(
-        p.demographics.occupation
-        in {
-            "software engineer",
-            "data scientist",
-            "product manager",
-            "engineering manager",
-            "principal engineer",
-            "business analyst",
-            "technician",
-        }
-        for p in personas
+    assert all(p.demographics.occupation in _TECH_OCCUPATIONS for p in personas)
+
+
+def _run_seed(seed: int) -> tuple[float, float]:
+    generator = PersonaGenerator(seed=seed)
+    personas = generator.generate(
+        n=8,
+        product_concept="Self-heating lunchbox",
+        category="kitchen gadget",
     )
+    valences = [p.opinion_valence for p in personas if p.opinion_valence is not None]
+    return min(valences), max(valences)
 
 
 def test_opinion_valences_span_range_across_runs() -> None:
-    lows: list[float] = []
-    highs: list[float] = []
-    for seed in range(10):
-        generator = PersonaGenerator(seed=seed)
-        personas = generator.generate(
-            n=8,
-            product_concept="Self-heating lunchbox",
-            category="kitchen gadget",
-        )
-        valences = [p.opinion_valence for p in personas if p.opinion_valence is not None]
-        lows.append(min(valences))
-        highs.append(max(valences))
+    results = [_run_seed(seed) for seed in range(10)]
+    lows = [low for low, _ in results]
+    highs = [high for _, high in results]
 
     assert min(lows) < -0.45
     assert max(highs) > 0.45
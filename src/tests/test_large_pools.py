@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-import asyncio
-
+import numpy as np
 import pytest
 
 from discussion.llm_client import MockLLMClient
@@ -10,120 +9,55 @@ from discussion.moderator import Moderator
 from discussion.participant import Participant
 from discussion.simulator import DiscussionSimulator
 from persona_engine.demographics import STATE_REGION
-from persona_engine.generator import PersonaGenerator
-from persona_engine.models import (
-    ConsumerProfile,
-    Demographics,
-    Location,
-    OceanScores,
-    Persona,
-    Psychographics,
-    SchwartzValues,
-    VoiceProfile,
-)
-
+from tests._llm_mocks import CachedMockLLMClient
+from tests._persona_factory import fast_persona
 
-def _persona(idx: int, extraversion: float = 60.0) -> Persona:
-    name = f"Person{idx}"
-    return Persona(
-        id=f"pid-{idx}",
-        name=name,
-        demographics=Demographics(
-            age=25 + idx,
-            gender="male" if idx % 2 == 0 else "female",
-            income=50000 + (idx * 5000),
-            education="bachelor",
-            occupation="analyst",
-            location=Location(state="TX", metro_area="Austin", urbanicity="urban"),
-            household_type="single",
-            race_ethnicity="mixed",
-        ),
-        psychographics=Psychographics(
-            ocean=OceanScores(
-                openness=55, conscientiousness=60, extraversion=extraversion,
-                agreeableness=55, neuroticism=45,
-            ),
-            vals_type="Achiever",
-            schwartz_values=SchwartzValues(primary="achievement", secondary="security"),
-        ),
-        consumer=ConsumerProfile(
-            price_sensitivity=0.5, brand_loyalty=0.4, research_tendency=0.5,
-            impulse_tendency=0.5, social_influence=0.5, risk_tolerance=0.5,
-            category_engagement="medium", decision_style="balanced",
-        ),
-        voice=VoiceProfile(
-            vocabulary_level="medium", verbosity="medium", hedging_tendency=0.4,
-            emotional_expressiveness=0.4, assertiveness=0.5, humor_tendency=0.3,
-            communication_style="conversational",
-        ),
-        initial_opinion="Neutral",
-        opinion_valence=0.0,
-    )
+_SHARED_MOCK = MockLLMClient()
+# Lower bounds of PersonaGenerator._age_bracket's brackets (18-24, 25-34, ..., 65+).
+_AGE_EDGES = np.array([18, 25, 35, 45, 55, 65])
 
 
 # --- Validation tests ---
 
-def test_num_personas_min_validation() -> None:
-    with pytest.raises(ValueError, match="num_personas must be between 4 and 48"):
-        DiscussionConfig(product_concept="test", category="test", num_personas=2)
-
-
-def test_num_personas_max_validation() -> None:
-    with pytest.raises(ValueError, match="num_personas must be between 4 and 48"):
-        DiscussionConfig(product_concept="test", category="test", num_personas=50)
-
-
-def test_num_personas_valid_range() -> None:
-    for n in [4, 8, 16, 24, 48]:
+@pytest.mark.parametrize(
+    ("n", "should_raise"),
+    [(2, True), (50, True), (4, False), (8, False), (16, False), (24, False), (48, False)],
+)
+def test_num_personas_validation(n: int, should_raise: bool) -> None:
+    if should_raise:
+        with pytest.raises(ValueError, match="num_personas must be between 4 and 48"):
+            DiscussionConfig(product_concept="test", category="test", num_personas=n)
+    else:
         config = DiscussionConfig(product_concept="test", category="test", num_personas=n)
         assert config.num_personas == n
 
 
 # --- Auto-scaling tests ---
 
-def test_auto_scale_small_pool() -> None:
-    config = DiscussionConfig(product_concept="test", category="test", num_personas=6)
-    sim = DiscussionSimulator(config=config, llm_client=MockLLMClient())
-    sim._auto_scale_config()
-    assert config.max_responses_per_question == 5
-    assert config.questions_per_phase == 2
-
-
-def test_auto_scale_medium_pool() -> None:
-    config = DiscussionConfig(product_concept="test", category="test", num_personas=12)
-    sim = DiscussionSimulator(config=config, llm_client=MockLLMClient())
-    sim._auto_scale_config()
-    assert config.max_responses_per_question == 7
-
-
-def test_auto_scale_large_pool() -> None:
-    config = DiscussionConfig(product_concept="test", category="test", num_personas=20)
-    sim = DiscussionSimulator(config=config, llm_client=MockLLMClient())
-    sim._auto_scale_config()
-    assert config.max_responses_per_question == 8
-    assert config.questions_per_phase == 3
-
-
-def test_auto_scale_xlarge_pool() -> None:
-    config = DiscussionConfig(product_concept="test", category="test", num_personas=30)
-    sim = DiscussionSimulator(config=config, llm_client=MockLLMClient())
+@pytest.mark.parametrize(
+    ("n", "exp_max", "exp_qpp"),
+    [(6, 5, 2), (12, 7, None), (20, 8, 3), (30, 10, 3)],
+)
+def test_auto_scale(n: int, exp_max: int, exp_qpp: int | None) -> None:
+    config = DiscussionConfig(product_concept="test", category="test", num_personas=n)
+    sim = DiscussionSimulator(config=config, llm_client=_SHARED_MOCK)
     sim._auto_scale_config()
-    assert config.max_responses_per_question == 10
-    assert config.questions_per_phase == 3
+    assert config.max_responses_per_question == exp_max
+    if exp_qpp is not None:
+        assert config.questions_per_phase == exp_qpp
 
 
 # --- Persona generation diversity tests ---
 
-def test_persona_generation_16_has_age_diversity() -> None:
-    gen = PersonaGenerator(seed=42)
-    personas = gen.generate(n=16, product_concept="test widget", category="gadgets")
-    age_brackets = {gen._age_bracket(p.demographics.age) for p in personas}
-    assert len(age_brackets) >= 3, f"Only {len(age_brackets)} age brackets: {age_brackets}"
+def test_persona_generation_16_has_age_diversity(generate_personas) -> None:
+    personas = generate_personas(42, 16, "test widget", "gadgets")
+    ages = np.fromiter((p.demographics.age for p in personas), dtype=np.int16, count=len(personas))
+    age_brackets = np.unique(np.digitize(ages, _AGE_EDGES))
+    assert age_brackets.size >= 3, f"Only {age_brackets.size} age brackets: {age_brackets}"
 
 
-def test_persona_generation_24_has_region_diversity() -> None:
-    gen = PersonaGenerator(seed=42)
-    personas = gen.generate(n=24, product_concept="test widget", category="gadgets")
+def test_persona_generation_24_has_region_diversity(generate_personas) -> None:
+    personas = generate_personas(42, 24, "test widget", "gadgets")
     regions = {STATE_REGION.get(p.demographics.location.state, "unknown") for p in personas}
     assert len(regions) >= 4, f"Only {len(regions)} regions: {regions}"
 
@@ -134,26 +68,28 @@ def test_select_respondents_large_pool_includes_quiet() -> None:
     """For >12 participants, quiet personas should be represented."""
     config = DiscussionConfig(product_concept="test", category="test", num_personas=16,
                               max_responses_per_question=7)
-    moderator = Moderator(config=config, llm_client=MockLLMClient())
+    moderator = Moderator(config=config, llm_client=_SHARED_MOCK)
 
     # Create participants with varying extraversion
     participants = []
     for i in range(16):
         ext = 20 + i * 5  # 20 to 95
-        participants.append(Participant(_persona(i, extraversion=ext), MockLLMClient()))
+        participants.append(Participant(fast_persona(i, extraversion=ext), _SHARED_MOCK))
+
+    moderator.precompute_pool(participants)
 
     # Run selection multiple times
     quiet_ids = {p.persona.id for p in participants if p.persona.psychographics.ocean.extraversion < 50}
 
+    # Loop invariants bound once.
+    select = moderator.select_respondents
+    question = "What do you think?"
+    deep_dive = DiscussionPhase.DEEP_DIVE
+
     total_quiet_selected = 0
     total_selected = 0
     for turn in range(6):
-        selected = moderator.select_respondents(
-            participants=participants,
-            question="What do you think?",
-            phase=DiscussionPhase.DEEP_DIVE,
-            turn=turn,
-        )
+        selected = select(participants=participants, question=question, phase=deep_dive, turn=turn)
         total_selected += len(selected)
         total_quiet_selected += sum(1 for p in selected if p.persona.id in quiet_ids)
 
@@ -161,16 +97,29 @@ def test_select_respondents_large_pool_includes_quiet() -> None:
     assert total_quiet_selected >= 3, f"Quiet personas only selected {total_quiet_selected} times in {total_selected} total"
 
 
+def test_precompute_pool_tracks_extraversion_changes() -> None:
+    config = DiscussionConfig(product_concept="test", category="test", num_personas=16)
+    moderator = Moderator(config=config, llm_client=_SHARED_MOCK)
+    participants = [
+        Participant(fast_persona(i, extraversion=20 + i * 5), _SHARED_MOCK) for i in range(16)
+    ]
+    quietest = participants[0].persona
+    assert quietest.id in moderator.precompute_pool(participants)
+
+    quietest.psychographics.ocean.extraversion = 99
+    assert quietest.id not in moderator.precompute_pool(participants)
+
+
 # --- Full simulation with 16 personas ---
 
-def test_simulation_16_personas() -> None:
+async def test_simulation_16_personas() -> None:
     config = DiscussionConfig(
         product_concept="Smart water bottle",
         category="fitness",
         num_personas=16,
     )
-    simulator = DiscussionSimulator(config=config, llm_client=MockLLMClient())
-    transcript = asyncio.run(simulator.run())
+    simulator = DiscussionSimulator(config=config, llm_client=CachedMockLLMClient())
+    transcript = await simulator.run()
 
     participant_ids = {
         m.speaker_id for m in transcript.messages if m.role == MessageRole.PARTICIPANT
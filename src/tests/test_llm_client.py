@@ -1,12 +1,9 @@
 from __future__ import annotations
 
-import asyncio
-import time
-from datetime import UTC, datetime
-from email.utils import format_datetime
-
 from discussion.llm_client import LLMClient, MockLLMClient
 
+_FUTURE_HTTP_DATE = "Wed, 21 Oct 2099 07:28:00 GMT"
+
 
 class _FailingLimiter:
     async def acquire(self) -> None:
@@ -30,7 +27,7 @@ class _HeaderResponse:
             self.headers["retry-after"] = retry_after
 
 
-def test_mock_client_explicitly_bypasses_limiter_breaker_and_http() -> None:
+async def test_mock_client_explicitly_bypasses_limiter_breaker_and_http() -> None:
     mock = MockLLMClient()
 
     # Inject exploding objects; if any transport path is touched this test fails.
@@ -38,19 +35,16 @@ def test_mock_client_explicitly_bypasses_limiter_breaker_and_http() -> None:
     mock._circuit_breaker = _FailingBreaker()
     mock._shared_client = _FailingHTTPClient()
 
-    result = asyncio.run(mock.complete(system_prompt="sys", user_prompt="usr"))
+    result = await mock.complete(system_prompt="sys", user_prompt="usr")
 
     assert isinstance(result, str)
     assert result
 
 
-def test_mock_client_context_manager_and_aclose_are_noop_safe() -> None:
-    async def _run() -> None:
-        async with MockLLMClient() as client:
-            assert isinstance(client, MockLLMClient)
-        await client.aclose()
-
-    asyncio.run(_run())
+async def test_mock_client_context_manager_and_aclose_are_noop_safe() -> None:
+    async with MockLLMClient() as client:
+        assert isinstance(client, MockLLMClient)
+    await client.aclose()
 
 
 def test_retry_after_parses_seconds_and_units() -> None:
@@ -62,12 +56,11 @@ def test_retry_after_parses_seconds_and_units() -> None:
 
 
 def test_retry_after_parses_http_date() -> None:
-    future = time.time() + 4.0
-    retry_after = format_datetime(datetime.fromtimestamp(future, tz=UTC), usegmt=True)
-    response = _HeaderResponse(retry_after)
+    response = _HeaderResponse(_FUTURE_HTTP_DATE)
 
     delay = LLMClient._retry_after_seconds(response, attempt=0)
-    assert 0.0 <= delay <= 5.0
+    # A parsed far-future date dwarfs any backoff fallback.
+    assert LLMClient._compute_backoff(0) < delay <= 10**10
 
 
 def test_retry_after_invalid_header_falls_back_to_backoff() -> None:
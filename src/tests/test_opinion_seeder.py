@@ -1,11 +1,10 @@
 from __future__ import annotations
 
-from persona_engine.generator import PersonaGenerator
 from persona_engine.opinion_seeder import OpinionSeeder
 
 
-def test_opinion_seeder_sets_valence_and_text() -> None:
-    personas = PersonaGenerator(seed=11).generate(n=8)
+def test_opinion_seeder_sets_valence_and_text(generate_personas) -> None:
+    personas = generate_personas(11, 8, mutable=True)
     seeded = OpinionSeeder().seed_opinions(personas, "AI wardrobe planner", "mobile app")
 
     assert all(p.opinion_valence is not None for p in seeded)
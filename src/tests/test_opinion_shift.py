@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-import asyncio
 import json
+from collections import deque
 
 from discussion.llm_client import MockLLMClient
 from discussion.models import DiscussionMessage, DiscussionPhase, MessageRole
@@ -56,39 +56,52 @@ def _make_persona(name: str = "TestUser", valence: float = -0.5) -> Persona:
 
 
 def _make_context(n: int = 4) -> list[DiscussionMessage]:
-    msgs = []
-    for i in range(n):
-        msgs.append(DiscussionMessage(
+    # Inputs are fixed test data, so skip pydantic validation.
+    return [
+        DiscussionMessage.model_construct(
             role=MessageRole.PARTICIPANT,
             speaker_id=f"id-other-{i}",
             speaker_name=f"Other{i}",
             content=f"I think this product looks promising in area {i}.",
             phase=DiscussionPhase.DEEP_DIVE,
             turn_number=i + 1,
-        ))
-    return msgs
+        )
+        for i in range(n)
+    ]
+
+
+# Shared fixtures: the blueprint's nested models are never mutated by the tests, and
+# each test gets a shallow copy so its own opinion_valence updates stay isolated.
+_PERSONA_BLUEPRINT = _make_persona("TestUser", -0.5)
+_CTX = tuple(_make_context(4))
+
+
+def _persona_with_valence(valence: float) -> Persona:
+    return _PERSONA_BLUEPRINT.model_copy(update={"opinion_valence": valence})
 
 
 class ShiftMockLLMClient(MockLLMClient):
     """Mock that returns controllable shift results."""
 
-    def __init__(self, shift_response: dict | str | None = None):
+    def __init__(self, shift_response: dict | str | None = None, shift_responses: list[dict | str] | None = None):
         super().__init__()
         self._shift_response = shift_response
+        self._shift_responses = deque(shift_responses or [])
 
     async def complete(self, system_prompt: str, user_prompt: str, temperature: float = 0.9, max_tokens: int = 300) -> str:
         if "classify opinion shifts" in system_prompt.lower() or "shifted their opinion" in user_prompt.lower():
-            if isinstance(self._shift_response, dict):
-                return json.dumps(self._shift_response)
-            if isinstance(self._shift_response, str):
-                return self._shift_response
+            shift_response = self._shift_responses.popleft() if self._shift_responses else self._shift_response
+            if isinstance(shift_response, dict):
+                return json.dumps(shift_response)
+            if isinstance(shift_response, str):
+                return shift_response
             return '{"reasoning": "no shift", "changed_mind": false, "shift_magnitude": "none", "new_valence": -0.5}'
         return await super().complete(system_prompt, user_prompt, temperature, max_tokens)
 
 
-def test_opinion_shift_detected_via_llm() -> None:
+async def test_opinion_shift_detected_via_llm() -> None:
     """LLM detects a shift and valence is updated."""
-    persona = _make_persona(valence=-0.5)
+    persona = _persona_with_valence(-0.5)
     client = ShiftMockLLMClient({
         "reasoning": "Participant became positive",
         "changed_mind": True,
@@ -96,21 +109,20 @@ def test_opinion_shift_detected_via_llm() -> None:
         "new_valence": 0.3,
     })
     participant = Participant(persona=persona, llm_client=client)
-    context = _make_context()
 
-    msg = asyncio.run(participant.respond(
+    msg = await participant.respond(
         moderator_question="What do you think now?",
-        discussion_context=context,
+        discussion_context=list(_CTX),
         phase=DiscussionPhase.DEEP_DIVE,
-    ))
+    )
 
     assert msg.changed_mind is True
     assert persona.opinion_valence == 0.3
 
 
-def test_opinion_shift_not_detected() -> None:
+async def test_opinion_shift_not_detected() -> None:
     """No shift means valence stays the same."""
-    persona = _make_persona(valence=-0.5)
+    persona = _persona_with_valence(-0.5)
     client = ShiftMockLLMClient({
         "reasoning": "No change",
         "changed_mind": False,
@@ -119,35 +131,35 @@ def test_opinion_shift_not_detected() -> None:
     })
     participant = Participant(persona=persona, llm_client=client)
 
-    msg = asyncio.run(participant.respond(
+    msg = await participant.respond(
         moderator_question="Any thoughts?",
-        discussion_context=_make_context(),
+        discussion_context=list(_CTX),
         phase=DiscussionPhase.REACTION,
-    ))
+    )
 
     assert msg.changed_mind is False
     assert persona.opinion_valence == -0.5
 
 
-def test_opinion_shift_fallback_to_heuristic() -> None:
+async def test_opinion_shift_fallback_to_heuristic() -> None:
     """Invalid JSON falls back to heuristic."""
-    persona = _make_persona(valence=-0.5)
+    persona = _persona_with_valence(-0.5)
     client = ShiftMockLLMClient("not valid json at all")
     participant = Participant(persona=persona, llm_client=client)
 
     # Should not crash; heuristic runs instead
-    msg = asyncio.run(participant.respond(
+    msg = await participant.respond(
         moderator_question="What do you think?",
-        discussion_context=_make_context(),
+        discussion_context=list(_CTX),
         phase=DiscussionPhase.SYNTHESIS,
-    ))
+    )
 
     assert isinstance(msg.changed_mind, bool)
 
 
-def test_no_shift_detection_in_warmup() -> None:
+async def test_no_shift_detection_in_warmup() -> None:
     """Warmup phase should skip shift detection entirely."""
-    persona = _make_persona(valence=-0.5)
+    persona = _persona_with_valence(-0.5)
     # This client would detect a shift if called
     client = ShiftMockLLMClient({
         "reasoning": "shift",
@@ -157,19 +169,19 @@ def test_no_shift_detection_in_warmup() -> None:
     })
     participant = Participant(persona=persona, llm_client=client)
 
-    msg = asyncio.run(participant.respond(
+    msg = await participant.respond(
         moderator_question="Tell us about yourself.",
         discussion_context=[],
         phase=DiscussionPhase.WARMUP,
-    ))
+    )
 
     assert msg.changed_mind is False
     assert persona.opinion_valence == -0.5  # Unchanged
 
 
-def test_no_shift_detection_in_exploration() -> None:
+async def test_no_shift_detection_in_exploration() -> None:
     """Exploration phase should also skip shift detection."""
-    persona = _make_persona(valence=0.3)
+    persona = _persona_with_valence(0.3)
     client = ShiftMockLLMClient({
         "reasoning": "shift",
         "changed_mind": True,
@@ -178,38 +190,39 @@ def test_no_shift_detection_in_exploration() -> None:
     })
     participant = Participant(persona=persona, llm_client=client)
 
-    msg = asyncio.run(participant.respond(
+    msg = await participant.respond(
         moderator_question="What comes to mind?",
         discussion_context=[],
         phase=DiscussionPhase.EXPLORATION,
-    ))
+    )
 
     assert msg.changed_mind is False
     assert persona.opinion_valence == 0.3
 
 
-def test_cumulative_valence_drift() -> None:
+async def test_cumulative_valence_drift() -> None:
     """Multiple shifts should track cumulative drift."""
-    persona = _make_persona(valence=-0.6)
+    persona = _persona_with_valence(-0.6)
+    client = ShiftMockLLMClient(shift_responses=[
+        {
+            "reasoning": "slight positive",
+            "changed_mind": True,
+            "shift_magnitude": "slight",
+            "new_valence": -0.2,
+        },
+        {
+            "reasoning": "now positive",
+            "changed_mind": True,
+            "shift_magnitude": "moderate",
+            "new_valence": 0.3,
+        },
+    ])
+    participant = Participant(persona=persona, llm_client=client)
 
     # First shift
-    client1 = ShiftMockLLMClient({
-        "reasoning": "slight positive",
-        "changed_mind": True,
-        "shift_magnitude": "slight",
-        "new_valence": -0.2,
-    })
-    p1 = Participant(persona=persona, llm_client=client1)
-    asyncio.run(p1.respond("Q1?", _make_context(), DiscussionPhase.DEEP_DIVE))
+    await participant.respond("Q1?", list(_CTX), DiscussionPhase.DEEP_DIVE)
     assert persona.opinion_valence == -0.2
 
     # Second shift
-    client2 = ShiftMockLLMClient({
-        "reasoning": "now positive",
-        "changed_mind": True,
-        "shift_magnitude": "moderate",
-        "new_valence": 0.3,
-    })
-    p2 = Participant(persona=persona, llm_client=client2)
-    asyncio.run(p2.respond("Q2?", _make_context(), DiscussionPhase.REACTION))
+    await participant.respond("Q2?", list(_CTX), DiscussionPhase.REACTION)
     assert persona.opinion_valence == 0.3
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-import asyncio
 import random
 
+import numpy as np
+import pytest
+
 from discussion.llm_client import MockLLMClient
 from discussion.models import DiscussionPhase
 from discussion.participant import Participant
@@ -17,6 +19,8 @@ from persona_engine.models import (
     VoiceProfile,
 )
 
+_SHARED_MOCK = MockLLMClient()
+
 
 def _make_persona(name: str, extraversion: float, agreeableness: float = 50.0) -> Persona:
     return Persona(
@@ -68,7 +72,7 @@ def _make_persona(name: str, extraversion: float, agreeableness: float = 50.0) -
 
 
 def test_build_system_prompt_uses_natural_language_without_trait_numbers() -> None:
-    participant = Participant(_make_persona("Emma", extraversion=82), MockLLMClient())
+    participant = Participant(_make_persona("Emma", extraversion=82), _SHARED_MOCK)
     prompt = participant.build_system_prompt()
 
     assert "curious" in prompt.lower()
@@ -78,27 +82,31 @@ def test_build_system_prompt_uses_natural_language_without_trait_numbers() -> No
     assert "72" not in prompt
 
 
-def test_should_speak_high_extraversion_more_than_low_extraversion() -> None:
-    high = Participant(_make_persona("HighE", extraversion=85), MockLLMClient())
-    low = Participant(_make_persona("LowE", extraversion=20), MockLLMClient())
+def test_should_speak_high_extraversion_more_than_low_extraversion(monkeypatch: pytest.MonkeyPatch) -> None:
+    high = Participant(_make_persona("HighE", extraversion=85), _SHARED_MOCK)
+    low = Participant(_make_persona("LowE", extraversion=20), _SHARED_MOCK)
 
-    random.seed(123)
-    high_count = sum(high.should_speak(DiscussionPhase.EXPLORATION, i) for i in range(100))
-    random.seed(123)
-    low_count = sum(low.should_speak(DiscussionPhase.EXPLORATION, i) for i in range(100))
+    draws = np.random.default_rng(123).random(100)
+    high_count = (draws < high._speak_probability(high.persona.psychographics.ocean.extraversion)).sum()
+    low_count = (draws < low._speak_probability(low.persona.psychographics.ocean.extraversion)).sum()
 
     assert high_count > low_count
 
+    # Same check through the public method, replaying one seeded stream per participant.
+    def speak_count(participant: Participant) -> int:
+        monkeypatch.setattr("discussion.participant.random", random.Random(123))
+        return sum(participant.should_speak(DiscussionPhase.EXPLORATION, turn) for turn in range(100))
+
+    assert speak_count(high) > speak_count(low)
+
 
-def test_respond_returns_message_with_speaker_and_phase() -> None:
-    participant = Participant(_make_persona("Ava", extraversion=78), MockLLMClient())
+async def test_respond_returns_message_with_speaker_and_phase() -> None:
+    participant = Participant(_make_persona("Ava", extraversion=78), _SHARED_MOCK)
 
-    message = asyncio.run(
-        participant.respond(
-            moderator_question="What comes to mind when you hear this concept?",
-            discussion_context=[],
-            phase=DiscussionPhase.EXPLORATION,
-        )
+    message = await participant.respond(
+        moderator_question="What comes to mind when you hear this concept?",
+        discussion_context=[],
+        phase=DiscussionPhase.EXPLORATION,
     )
 
     assert message.speaker_id == "id-Ava"
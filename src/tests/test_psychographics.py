@@ -19,29 +19,39 @@ def _demo(age: int, gender: str, income: int = 90_000, education: str = "bachelo
     )
 
 
+def _ocean_matrix(psy_list) -> np.ndarray:
+    out = np.empty((len(psy_list), 5), dtype=np.float64)
+    for i, p in enumerate(psy_list):
+        ocean = p.ocean
+        out[i] = (ocean.openness, ocean.conscientiousness, ocean.extraversion, ocean.agreeableness, ocean.neuroticism)
+    return out
+
+
 def test_ocean_age_gender_adjustments_directionally_hold() -> None:
     rng = np.random.default_rng(123)
 
-    young_males = [_demo(25, "male") for _ in range(300)]
-    older_males = [_demo(65, "male") for _ in range(300)]
-    females = [_demo(35, "female") for _ in range(300)]
-    males = [_demo(35, "male") for _ in range(300)]
+    young_male = _demo(25, "male")
+    young_males = [young_male] * 300
+    older_males = [_demo(65, "male")] * 300
+    females = [_demo(35, "female")] * 300
+    males = [_demo(35, "male")] * 300
 
     psy_young = generate_psychographics(young_males, rng=rng)
     psy_old = generate_psychographics(older_males, rng=rng)
     psy_f = generate_psychographics(females, rng=rng)
     psy_m = generate_psychographics(males, rng=rng)
 
-    mean_e_young = np.mean([p.ocean.extraversion for p in psy_young])
-    mean_e_old = np.mean([p.ocean.extraversion for p in psy_old])
-    assert mean_e_old < mean_e_young
+    # Sharing one Demographics per cohort relies on the generator treating it as read-only.
+    assert young_male == _demo(25, "male")
+
+    mean_young = _ocean_matrix(psy_young).mean(axis=0)
+    mean_old = _ocean_matrix(psy_old).mean(axis=0)
+    assert mean_old[2] < mean_young[2]
 
-    mean_a_f = np.mean([p.ocean.agreeableness for p in psy_f])
-    mean_a_m = np.mean([p.ocean.agreeableness for p in psy_m])
-    mean_n_f = np.mean([p.ocean.neuroticism for p in psy_f])
-    mean_n_m = np.mean([p.ocean.neuroticism for p in psy_m])
-    assert mean_a_f > mean_a_m
-    assert mean_n_f > mean_n_m
+    mean_f = _ocean_matrix(psy_f).mean(axis=0)
+    mean_m = _ocean_matrix(psy_m).mean(axis=0)
+    assert mean_f[3] > mean_m[3]
+    assert mean_f[4] > mean_m[4]
 
 
 def test_vals_assignment_consistency() -> None:
@@ -1,43 +1,87 @@
 from __future__ import annotations
 
 import asyncio
+import random
 from pathlib import Path
 
+import pytest
+from jinja2 import FileSystemLoader, ModuleLoader
+
 from analysis.analyzer import AnalysisEngine
 from discussion.llm_client import MockLLMClient
-from discussion.models import DiscussionConfig
+from discussion.models import DiscussionConfig, DiscussionMessage, DiscussionPhase, MessageRole
 from discussion.simulator import DiscussionSimulator
-from report.generator import ReportGenerator
+from report.generator import COMPILED_TEMPLATES_ENV, ReportGenerator
+from tests._persona_factory import fast_persona
+from tests._report_factory import make_analysis_report, make_transcript
 
 
-def _build_pipeline_output():
+@pytest.fixture(scope="module")
+def pipeline_output():
+    # Shared across tests; they only read the transcript, report and personas.
     config = DiscussionConfig(
         product_concept="AI meal planning app",
         category="food_tech",
         num_personas=8,
     )
     simulator = DiscussionSimulator(config=config, llm_client=MockLLMClient())
-    transcript = asyncio.run(simulator.run())
-
     engine = AnalysisEngine(llm_client=MockLLMClient())
-    report = asyncio.run(engine.analyze(transcript))
+
+    async def _run():
+        transcript = await simulator.run()
+        return transcript, await engine.analyze(transcript)
+
+    # Participant.should_speak draws from the module-level RNG; give it a seeded
+    # private one so the output is deterministic and the global RNG is untouched.
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("discussion.participant.random", random.Random(config.seed))
+        transcript, report = asyncio.run(_run())
     return transcript, report, transcript.personas
 
 
-def test_generate_html_returns_valid_html() -> None:
-    transcript, report, personas = _build_pipeline_output()
-    generator = ReportGenerator()
+@pytest.fixture(scope="module")
+def synthetic_pipeline_output():
+    # Hand-built report inputs for tests that only check the HTML structure.
+    personas = [fast_persona(idx) for idx in range(4)]
+    messages: list[DiscussionMessage] = []
+    for phase in (DiscussionPhase.WARMUP, DiscussionPhase.EXPLORATION):
+        for idx, persona in enumerate(personas):
+            messages.append(
+                DiscussionMessage(
+                    role=MessageRole.PARTICIPANT,
+                    speaker_id=persona.id,
+                    speaker_name=persona.name,
+                    content=f"{persona.name} thinks it could work.",
+                    phase=phase,
+                    turn_number=len(messages) + 1,
+                    sentiment=0.2 * (idx - 1),
+                )
+            )
+    report = make_analysis_report({persona.id: {"purchase_intent": 2.0 + idx} for idx, persona in enumerate(personas)})
+    return make_transcript(messages), report, personas
+
+
+@pytest.fixture(scope="module")
+def synthetic_html(synthetic_pipeline_output) -> str:
+    transcript, report, personas = synthetic_pipeline_output
+    return ReportGenerator().generate_html(report=report, transcript=transcript, personas=personas)
+
 
-    html = generator.generate_html(report=report, transcript=transcript, personas=personas)
+@pytest.fixture(scope="module")
+def rendered_html(pipeline_output) -> str:
+    transcript, report, personas = pipeline_output
+    return ReportGenerator().generate_html(report=report, transcript=transcript, personas=personas)
+
+
+def test_generate_html_returns_valid_html(synthetic_html: str) -> None:
+    html = synthetic_html
 
     assert html.startswith("<!DOCTYPE html>")
     assert "</html>" in html
 
 
-def test_output_contains_all_section_headers() -> None:
-    transcript, report, personas = _build_pipeline_output()
-    generator = ReportGenerator()
-    html = generator.generate_html(report=report, transcript=transcript, personas=personas)
+def test_output_contains_all_section_headers(synthetic_html: str) -> None:
+    html = synthetic_html
 
     expected_sections = [
         "Executive Summary",
@@ -54,19 +98,16 @@ def test_output_contains_all_section_headers() -> None:
         assert section in html
 
 
-def test_output_contains_svg_elements() -> None:
-    transcript, report, personas = _build_pipeline_output()
-    generator = ReportGenerator()
-    html = generator.generate_html(report=report, transcript=transcript, personas=personas)
+def test_output_contains_svg_elements(synthetic_html: str) -> None:
+    html = synthetic_html
 
     assert "<svg" in html
     assert "</svg>" in html
 
 
-def test_output_contains_participant_names_and_summary() -> None:
-    transcript, report, personas = _build_pipeline_output()
-    generator = ReportGenerator()
-    html = generator.generate_html(report=report, transcript=transcript, personas=personas)
+def test_output_contains_participant_names_and_summary(pipeline_output, rendered_html: str) -> None:
+    _, report, personas = pipeline_output
+    html = rendered_html
 
     for persona in personas[:3]:
         assert persona.name in html
@@ -74,8 +115,19 @@ def test_output_contains_participant_names_and_summary() -> None:
     assert report.executive_summary in html
 
 
-def test_save_html_creates_file_on_disk(tmp_path: Path) -> None:
-    transcript, report, personas = _build_pipeline_output()
+def test_summary_report_omits_transcript_rows(pipeline_output) -> None:
+    transcript, report, personas = pipeline_output
+    generator = ReportGenerator()
+
+    context = generator._prepare_context(report=report, transcript=transcript, personas=personas, include_transcript=False)
+
+    assert context["include_transcript"] is False
+    assert context["transcript_rows"] == []
+    assert [row["name"] for row in context["participant_rows"]] == [persona.name for persona in personas]
+
+
+def test_save_html_creates_file_on_disk(pipeline_output, tmp_path: Path) -> None:
+    transcript, report, personas = pipeline_output
     generator = ReportGenerator()
 
     output_path = tmp_path / "focus_group_report.html"
@@ -87,4 +139,39 @@ def test_save_html_creates_file_on_disk(tmp_path: Path) -> None:
     )
 
     assert Path(saved).exists()
-    assert Path(saved).read_text(encoding="utf-8").startswith("<!DOCTYPE html>")
+    with open(saved, "rb") as handle:
+        assert handle.read(15) == b"<!DOCTYPE html>"
+
+
+def test_compiled_templates_render_identically(pipeline_output, tmp_path: Path) -> None:
+    transcript, report, personas = pipeline_output
+    compiled_dir = ReportGenerator.compile_templates(tmp_path / "templates")
+
+    source_html = ReportGenerator(compiled_templates_dir=tmp_path / "missing").generate_html(
+        report=report, transcript=transcript, personas=personas
+    )
+    compiled_html = ReportGenerator(compiled_templates_dir=compiled_dir).generate_html(
+        report=report, transcript=transcript, personas=personas
+    )
+
+    assert compiled_html == source_html
+
+
+def test_stale_compiled_templates_fall_back_to_sources(tmp_path: Path) -> None:
+    compiled_dir = Path(ReportGenerator.compile_templates(tmp_path / "templates"))
+    assert isinstance(ReportGenerator(compiled_templates_dir=compiled_dir).env.loader, ModuleLoader)
+
+    (compiled_dir / "SOURCE_DIGEST").write_text("outdated")
+    ReportGenerator._environment_for.cache_clear()
+
+    assert isinstance(ReportGenerator(compiled_templates_dir=compiled_dir).env.loader, FileSystemLoader)
+
+
+def test_compiled_templates_dir_from_environment(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(COMPILED_TEMPLATES_ENV, raising=False)
+    assert isinstance(ReportGenerator().env.loader, FileSystemLoader)
+
+    compiled_dir = ReportGenerator.compile_templates(tmp_path / "templates")
+    monkeypatch.setenv(COMPILED_TEMPLATES_ENV, compiled_dir)
+
+    assert isinstance(ReportGenerator().env.loader, ModuleLoader)
@@ -1,10 +1,9 @@
 from __future__ import annotations
 
-import asyncio
+import pytest
 
 from analysis.models import ConceptScores, Theme
 from analysis.segment_analyzer import SegmentAnalyzer
-from discussion.llm_client import MockLLMClient
 from discussion.models import (
     DiscussionConfig,
     DiscussionMessage,
@@ -12,77 +11,23 @@ from discussion.models import (
     DiscussionTranscript,
     MessageRole,
 )
-from persona_engine.models import (
-    ConsumerProfile,
-    Demographics,
-    Location,
-    OceanScores,
-    Persona,
-    Psychographics,
-    SchwartzValues,
-    VoiceProfile,
-)
-
-
-def _persona(
-    idx: int,
-    age: int,
-    income: int,
-    gender: str,
-    openness: float,
-    agreeableness: float,
-    vals_type: str,
-    valence: float,
-) -> Persona:
-    return Persona(
-        id=f"p{idx}",
-        name=f"Person {idx}",
-        demographics=Demographics(
-            age=age,
-            gender=gender,
-            income=income,
-            education="bachelor",
-            occupation="analyst",
-            location=Location(state="NY", metro_area="New York", urbanicity="urban"),
-            household_type="single",
-            race_ethnicity="mixed",
-        ),
-        psychographics=Psychographics(
-            ocean=OceanScores(
-                openness=openness,
-                conscientiousness=60,
-                extraversion=55,
-                agreeableness=agreeableness,
-                neuroticism=45,
-            ),
-            vals_type=vals_type,
-            schwartz_values=SchwartzValues(primary="security", secondary="achievement"),
-        ),
-        consumer=ConsumerProfile(
-            price_sensitivity=0.5,
-            brand_loyalty=0.4,
-            research_tendency=0.6,
-            impulse_tendency=0.3,
-            social_influence=0.5,
-            risk_tolerance=0.5,
-            category_engagement="medium",
-            decision_style="balanced",
-        ),
-        voice=VoiceProfile(
-            vocabulary_level="medium",
-            verbosity="medium",
-            hedging_tendency=0.4,
-            emotional_expressiveness=0.4,
-            assertiveness=0.5,
-            humor_tendency=0.3,
-            communication_style="conversational",
-        ),
-        initial_opinion="initial",
-        opinion_valence=valence,
-    )
-
-
-def _themes() -> list[Theme]:
+from tests._llm_mocks import CachedMockLLMClient
+from tests._persona_factory import make_persona
+
+# ConceptScores validates (and so copies) each entry, so the template can be shared.
+_UNIFORM_SCORES = {
+    "purchase_intent": 4,
+    "overall_appeal": 4,
+    "uniqueness": 4,
+    "relevance": 4,
+    "believability": 4,
+    "value_perception": 4,
+}
+
+
+@pytest.fixture(scope="module")
+def themes() -> list[Theme]:
+    # Read-only for SegmentAnalyzer, so one validated list serves the module.
     return [
         Theme(
             name="Value and Pricing",
@@ -105,20 +50,21 @@ def _themes() -> list[Theme]:
     ]
 
 
-def test_segment_analyzer_identifies_meaningful_segments() -> None:
+async def test_segment_analyzer_identifies_meaningful_segments(themes: list[Theme]) -> None:
     personas = [
-        _persona(1, 28, 42_000, "female", 85, 65, "Experiencer", 0.7),
-        _persona(2, 31, 48_000, "female", 78, 70, "Experiencer", 0.6),
-        _persona(3, 47, 120_000, "male", 25, 30, "Thinker", -0.6),
-        _persona(4, 54, 135_000, "male", 30, 35, "Thinker", -0.7),
-        _persona(5, 39, 92_000, "female", 72, 60, "Achiever", 0.3),
-        _persona(6, 58, 88_000, "male", 35, 45, "Believer", -0.2),
+        make_persona(1, 28, 42_000, "female", 85, 65, "Experiencer", 0.7),
+        make_persona(2, 31, 48_000, "female", 78, 70, "Experiencer", 0.6),
+        make_persona(3, 47, 120_000, "male", 25, 30, "Thinker", -0.6),
+        make_persona(4, 54, 135_000, "male", 30, 35, "Thinker", -0.7),
+        make_persona(5, 39, 92_000, "female", 72, 60, "Achiever", 0.3),
+        make_persona(6, 58, 88_000, "male", 35, 45, "Believer", -0.2),
     ]
 
     config = DiscussionConfig(product_concept="AI budget planner", category="app")
     transcript = DiscussionTranscript(config=config, personas=personas)
-    transcript.messages = [
-        DiscussionMessage(
+    # Fixed test data, so skip pydantic validation.
+    transcript.messages.extend(
+        DiscussionMessage.model_construct(
             role=MessageRole.PARTICIPANT,
             speaker_id=persona.id,
             speaker_name=persona.name,
@@ -128,7 +74,7 @@ def test_segment_analyzer_identifies_meaningful_segments() -> None:
             sentiment=persona.opinion_valence,
         )
         for idx, persona in enumerate(personas)
-    ]
+    )
 
     concept_scores = ConceptScores(
         purchase_intent=0.5,
@@ -148,14 +94,12 @@ def test_segment_analyzer_identifies_meaningful_segments() -> None:
         },
     )
 
-    analyzer = SegmentAnalyzer(MockLLMClient())
-    segments = asyncio.run(
-        analyzer.analyze_segments(
-            transcript=transcript,
-            personas=personas,
-            concept_scores=concept_scores,
-            themes=_themes(),
-        )
+    analyzer = SegmentAnalyzer(CachedMockLLMClient())
+    segments = await analyzer.analyze_segments(
+        transcript=transcript,
+        personas=personas,
+        concept_scores=concept_scores,
+        themes=themes,
     )
 
     assert len(segments) >= 2
@@ -163,17 +107,18 @@ def test_segment_analyzer_identifies_meaningful_segments() -> None:
         assert segment.participant_ids
 
 
-def test_segment_analyzer_excludes_non_distinct_segments() -> None:
+async def test_segment_analyzer_excludes_non_distinct_segments(themes: list[Theme]) -> None:
     personas = [
-        _persona(1, 30, 60_000, "female", 55, 55, "Achiever", 0.0),
-        _persona(2, 34, 62_000, "male", 57, 53, "Achiever", 0.0),
-        _persona(3, 38, 64_000, "female", 56, 54, "Achiever", 0.0),
-        _persona(4, 42, 66_000, "male", 58, 52, "Achiever", 0.0),
+        make_persona(1, 30, 60_000, "female", 55, 55, "Achiever", 0.0),
+        make_persona(2, 34, 62_000, "male", 57, 53, "Achiever", 0.0),
+        make_persona(3, 38, 64_000, "female", 56, 54, "Achiever", 0.0),
+        make_persona(4, 42, 66_000, "male", 58, 52, "Achiever", 0.0),
     ]
     config = DiscussionConfig(product_concept="AI budget planner", category="app")
     transcript = DiscussionTranscript(config=config, personas=personas)
-    transcript.messages = [
-        DiscussionMessage(
+    # Fixed test data, so skip pydantic validation.
+    transcript.messages.extend(
+        DiscussionMessage.model_construct(
             role=MessageRole.PARTICIPANT,
             speaker_id=persona.id,
             speaker_name=persona.name,
@@ -183,7 +128,7 @@ def test_segment_analyzer_excludes_non_distinct_segments() -> None:
             sentiment=0.0,
         )
         for idx, persona in enumerate(personas)
-    ]
+    )
 
     concept_scores = ConceptScores(
         purchase_intent=1.0,
@@ -193,27 +138,15 @@ def test_segment_analyzer_excludes_non_distinct_segments() -> None:
         believability=1.0,
         value_perception=1.0,
         excitement_score=1.0,
-        participant_scores={
-            persona.id: {
-                "purchase_intent": 4,
-                "overall_appeal": 4,
-                "uniqueness": 4,
-                "relevance": 4,
-                "believability": 4,
-                "value_perception": 4,
-            }
-            for persona in personas
-        },
+        participant_scores={persona.id: _UNIFORM_SCORES for persona in personas},
     )
 
-    analyzer = SegmentAnalyzer(MockLLMClient())
-    segments = asyncio.run(
-        analyzer.analyze_segments(
-            transcript=transcript,
-            personas=personas,
-            concept_scores=concept_scores,
-            themes=_themes(),
-        )
+    analyzer = SegmentAnalyzer(CachedMockLLMClient())
+    segments = await analyzer.analyze_segments(
+        transcript=transcript,
+        personas=personas,
+        concept_scores=concept_scores,
+        themes=themes,
     )
 
     assert len(segments) == 1
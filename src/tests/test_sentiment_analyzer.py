@@ -7,27 +7,33 @@ from discussion.models import DiscussionMessage, DiscussionPhase, MessageRole
 
 
 class _BatchLLM:
+    """Returns ``payload`` from an already-resolved future, skipping coroutine setup per call."""
+
     def __init__(self, payload: str):
         self.payload = payload
+        self._done: asyncio.Future[str] | None = None
 
-    async def complete(
+    def complete(
         self,
         system_prompt: str,
         user_prompt: str,
         temperature: float = 0.0,
         max_tokens: int = 700,
-    ) -> str:
+    ) -> asyncio.Future[str]:
         del system_prompt, user_prompt, temperature, max_tokens
-        return self.payload
+        if self._done is None:
+            self._done = asyncio.get_running_loop().create_future()
+            self._done.set_result(self.payload)
+        return self._done
 
-    async def complete_json(
+    def complete_json(
         self,
         system_prompt: str,
         user_prompt: str,
         temperature: float = 0.0,
         max_tokens: int = 700,
-    ) -> str:
-        return await self.complete(system_prompt, user_prompt, temperature, max_tokens)
+    ) -> asyncio.Future[str]:
+        return self.complete(system_prompt, user_prompt, temperature, max_tokens)
 
 
 def _message(idx: int, text: str) -> DiscussionMessage:
@@ -41,7 +47,7 @@ def _message(idx: int, text: str) -> DiscussionMessage:
     )
 
 
-def test_batched_scoring_uses_llm_payload_when_lengths_match() -> None:
+async def test_batched_scoring_uses_llm_payload_when_lengths_match() -> None:
     analyzer = SentimentAnalyzer(_BatchLLM("[0.8, -0.2, 0.1]"))
     messages = [
         _message(1, "I love this concept and would buy it."),
@@ -49,12 +55,12 @@ def test_batched_scoring_uses_llm_payload_when_lengths_match() -> None:
         _message(3, "I need more details first."),
     ]
 
-    scores = asyncio.run(analyzer.analyze_batch(messages))
+    scores = await analyzer.analyze_batch(messages)
 
     assert scores == [0.8, -0.2, 0.1]
 
 
-def test_bug5_batched_scoring_fallback_preserves_message_count() -> None:
+async def test_bug5_batched_scoring_fallback_preserves_message_count() -> None:
     # BUG 5 regression guard: malformed batch payload should not drop scores.
     analyzer = SentimentAnalyzer(_BatchLLM("[0.9]"))
     messages = [
@@ -63,7 +69,7 @@ def test_bug5_batched_scoring_fallback_preserves_message_count() -> None:
         _message(3, "It seems okay so far."),
     ]
 
-    scores = asyncio.run(analyzer.analyze_batch(messages))
+    scores = await analyzer.analyze_batch(messages)
 
     assert len(scores) == len(messages)
     assert scores[0] > 0
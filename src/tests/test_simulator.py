@@ -1,52 +1,44 @@
 from __future__ import annotations
 
-import asyncio
-
-from discussion.llm_client import MockLLMClient
 from discussion.models import DiscussionConfig, DiscussionPhase, MessageRole
 from discussion.simulator import DiscussionSimulator
+from tests._llm_mocks import CachedMockLLMClient
 
 
-def test_full_simulation_with_mock_llm() -> None:
+async def test_full_simulation_with_mock_llm() -> None:
     config = DiscussionConfig(
         product_concept="AI meal planner",
         category="app",
         num_personas=8,
     )
-    simulator = DiscussionSimulator(config=config, llm_client=MockLLMClient())
-
-    transcript = asyncio.run(simulator.run())
+    simulator = DiscussionSimulator(config=config, llm_client=CachedMockLLMClient())
+
+    transcript = await simulator.run()
+
+    # One pass collects phases, speakers and roles; the bridge check then scans the role projection.
+    phases_seen: set[DiscussionPhase] = set()
+    participant_ids: set[str] = set()
+    roles: list[MessageRole] = []
+    for message in transcript.messages:
+        phases_seen.add(message.phase)
+        roles.append(message.role)
+        if message.role is MessageRole.PARTICIPANT:
+            participant_ids.add(message.speaker_id)
+
+    participant, moderator = MessageRole.PARTICIPANT, MessageRole.MODERATOR
+    found_bridge = any(
+        before is participant and middle is moderator and after is participant
+        for before, middle, after in zip(roles, roles[1:], roles[2:])
+    )
 
-    phases_seen = {message.phase for message in transcript.messages}
     assert set(config.phases).issubset(phases_seen)
 
-    participant_ids = {
-        message.speaker_id
-        for message in transcript.messages
-        if message.role == MessageRole.PARTICIPANT
-    }
     expected_ids = {persona.id for persona in transcript.personas}
     assert expected_ids.issubset(participant_ids)
 
-    moderator_indices = [
-        i for i, message in enumerate(transcript.messages) if message.role == MessageRole.MODERATOR
-    ]
-    participant_indices = [
-        i for i, message in enumerate(transcript.messages) if message.role == MessageRole.PARTICIPANT
-    ]
-    assert moderator_indices
-    assert participant_indices
-    assert transcript.messages[0].role == MessageRole.MODERATOR
-
-    found_bridge = False
-    for index in range(1, len(transcript.messages) - 1):
-        if (
-            transcript.messages[index - 1].role == MessageRole.PARTICIPANT
-            and transcript.messages[index].role == MessageRole.MODERATOR
-            and transcript.messages[index + 1].role == MessageRole.PARTICIPANT
-        ):
-            found_bridge = True
-            break
+    assert moderator in roles
+    assert participant in roles
+    assert roles[0] is moderator
     assert found_bridge
 
     total_messages = len(transcript.messages)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 from discussion.models import (
     DiscussionConfig,
     DiscussionMessage,
@@ -10,7 +12,9 @@ from discussion.models import (
 from discussion.transcript import TranscriptFormatter
 
 
-def _sample_transcript() -> DiscussionTranscript:
+@pytest.fixture(scope="module")
+def sample_transcript() -> DiscussionTranscript:
+    # TranscriptFormatter only reads the transcript, so one instance serves every test.
     config = DiscussionConfig(product_concept="Smart bottle", category="fitness")
     transcript = DiscussionTranscript(config=config, personas=[])
     transcript.messages.extend(
@@ -47,18 +51,16 @@ def _sample_transcript() -> DiscussionTranscript:
     return transcript
 
 
-def test_to_markdown_includes_phase_headers() -> None:
-    transcript = _sample_transcript()
-    markdown = TranscriptFormatter.to_markdown(transcript)
+def test_to_markdown_includes_phase_headers(sample_transcript: DiscussionTranscript) -> None:
+    markdown = TranscriptFormatter.to_markdown(sample_transcript)
 
     assert "## Phase: Warmup" in markdown
     assert "## Phase: Deep Dive" in markdown
     assert "**Moderator:**" in markdown
 
 
-def test_summary_stats_returns_expected_counts() -> None:
-    transcript = _sample_transcript()
-    stats = TranscriptFormatter.summary_stats(transcript)
+def test_summary_stats_returns_expected_counts(sample_transcript: DiscussionTranscript) -> None:
+    stats = TranscriptFormatter.summary_stats(sample_transcript)
 
     assert stats["total_messages_by_role"]["participant"] == 2
     assert stats["messages_per_phase"]["warmup"] == 2
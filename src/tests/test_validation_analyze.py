@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+_ANALYZE_PATH = Path(__file__).resolve().parents[2] / "validation" / "analyze.py"
+_spec = importlib.util.spec_from_file_location("validation_analyze", _ANALYZE_PATH)
+analyze = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(analyze)
+
+
+def test_extract_scores_prefers_first_variant_past_head_window(tmp_path: Path) -> None:
+    # Every field is present in the head, but purchase_intent only via its
+    # second-priority variant; the first-priority one sits past the window.
+    head_lines = [
+        "<p>Purchase Intent: 40%</p>",
+        *(f'<td>"{metric}": 70%</td>' for metric in analyze.METRICS[1:]),
+        "<p>Recommendation: GO</p>",
+        "<p>Excitement Score: 65%</p>",
+        "<p>5 themes from 120 messages</p>",
+    ]
+    padding = "<!-- filler -->\n" * (analyze._HEAD_BYTES // 16 + 1)
+    report = tmp_path / "concept_a_seed1.html"
+    report.write_text("\n".join(head_lines) + "\n" + padding + '<td>"purchase_intent": 55%</td>\n')
+    assert report.stat().st_size > analyze._HEAD_BYTES
+
+    scores = analyze.extract_scores_from_html(report)
+
+    assert scores["purchase_intent"] == 0.55
+    assert scores["overall_appeal"] == 0.70
+    assert scores["recommendation"] == "GO"
+    assert scores["message_count"] == 120
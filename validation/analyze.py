@@ -11,71 +11,193 @@ Outputs correlation report + publishable summary.
 """
 import argparse
 import json
+import os
 import re
 import sys
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from itertools import combinations
 from pathlib import Path
 
 import numpy as np
 
 # ─── Synthetic Data Extraction ───────────────────────────────────────────────
 
+METRICS = ["purchase_intent", "overall_appeal", "uniqueness", "relevance", "believability", "value_perception"]
+
+# Per-metric patterns, tried in priority order (the first variant that matches anywhere wins).
+# All patterns are ASCII and compiled as bytes, so reports are scanned without decoding.
+# Each is paired with its lowercase literal prefix: no match can start before the
+# first occurrence of that literal, so the regex search resumes from there.
+_METRIC_PATTERNS = tuple(
+    (
+        metric,
+        tuple(
+            (prefix.lower().encode("ascii"), re.compile(prefix.encode("ascii") + rest, re.IGNORECASE))
+            for prefix, rest in (
+                (metric, rb'["\s:]+(\d+(?:\.\d+)?)\s*%'),
+                (metric.replace("_", " ").title(), rb'[^0-9]*?(\d+(?:\.\d+)?)\s*%'),
+                (f"'{metric}'", rb":\s*(\d+(?:\.\d+)?)"),
+            )
+        ),
+    )
+    for metric in METRICS
+)
+
+# The summary fields cannot overlap one another, so a single scan keeping the
+# first hit per group is equivalent to one search per field. The count branches
+# are only entered at the start of a digit run followed by "t" or "m", so most
+# digits in the report cost one failed lookahead instead of two full attempts.
+_SUMMARY_RE = re.compile(
+    rb'Recommendation:\s*(?P<recommendation>GO|NO-GO|ITERATE)'
+    rb'|Excitement Score:\s*(?P<excitement_score>\d+(?:\.\d+)?)\s*%'
+    rb'|(?<!\d)(?=\d+\s*[tm])'
+    rb'(?:(?P<theme_count>\d+)\s*themes|(?P<message_count>\d+)\s*messages)'
+)
+
+
+# Scores sit near the top of a report; anything past this is transcript and
+# embedded assets, only read if a score or summary field is missing from the head.
+_HEAD_BYTES = 256 * 1024
+_SCORE_FIELDS = (*METRICS, "recommendation", "excitement_score", "theme_count", "message_count")
+
+
 def extract_scores_from_html(html_path: Path) -> dict:
     """Extract concept scores from a synthetic focus group HTML report."""
-    text = html_path.read_text()
-    
+    with html_path.open("rb") as f:
+        head = f.read(_HEAD_BYTES + 1)
+        if len(head) <= _HEAD_BYTES:
+            return _scan_report(head)
+
+        # Cut at a line break so no number is split across the window edge.
+        # A lower-priority metric variant in the head could be outranked by one
+        # further down, so the head only suffices if every metric hit its first.
+        ranks = {}
+        scores = _scan_report(head[:head.rfind(b"\n") + 1], ranks)
+        if all(field in scores for field in _SCORE_FIELDS) and not any(ranks.values()):
+            return scores
+
+        f.seek(0)
+        return _scan_report(f.read())
+
+
+def _scan_report(data: bytes, ranks: dict | None = None) -> dict:
+    """Run the metric and summary patterns over raw report bytes.
+
+    If ranks is given, it is filled with the index of the pattern variant
+    that matched for each metric found.
+    """
+    lowered = data.lower()
     scores = {}
-    # Look for score patterns in the HTML
-    metrics = ["purchase_intent", "overall_appeal", "uniqueness", "relevance", "believability", "value_perception"]
-    
-    for metric in metrics:
-        # Try multiple patterns
-        patterns = [
-            rf'{metric}["\s:]+(\d+(?:\.\d+)?)\s*%',
-            rf'{metric.replace("_", " ").title()}[^0-9]*?(\d+(?:\.\d+)?)\s*%',
-            rf"'{metric}':\s*(\d+(?:\.\d+)?)",
-        ]
-        for pat in patterns:
-            m = re.search(pat, text, re.IGNORECASE)
+    for metric, patterns in _METRIC_PATTERNS:
+        for rank, (prefix, pat) in enumerate(patterns):
+            start = lowered.find(prefix)
+            if start < 0:
+                continue
+            m = pat.search(data, start)
             if m:
                 scores[metric] = float(m.group(1)) / 100.0
+                if ranks is not None:
+                    ranks[metric] = rank
                 break
     
-    # Extract recommendation
-    rec_match = re.search(r'Recommendation:\s*(GO|NO-GO|ITERATE)', text)
-    if rec_match:
-        scores['recommendation'] = rec_match.group(1)
-    
-    # Extract excitement score
-    exc_match = re.search(r'Excitement Score:\s*(\d+(?:\.\d+)?)\s*%', text)
-    if exc_match:
-        scores['excitement_score'] = float(exc_match.group(1)) / 100.0
-    
-    # Extract theme count
-    theme_match = re.search(r'(\d+)\s*themes', text)
-    if theme_match:
-        scores['theme_count'] = int(theme_match.group(1))
-    
-    # Extract message count
-    msg_match = re.search(r'(\d+)\s*messages', text)
-    if msg_match:
-        scores['message_count'] = int(msg_match.group(1))
+    summary = {}
+    for m in _SUMMARY_RE.finditer(data):
+        summary.setdefault(m.lastgroup, m.group(m.lastgroup))
+        if len(summary) == 4:
+            break
+
+    if 'recommendation' in summary:
+        scores['recommendation'] = summary['recommendation'].decode("ascii")
+    if 'excitement_score' in summary:
+        scores['excitement_score'] = float(summary['excitement_score']) / 100.0
+    if 'theme_count' in summary:
+        scores['theme_count'] = int(summary['theme_count'])
+    if 'message_count' in summary:
+        scores['message_count'] = int(summary['message_count'])
     
     return scores
 
 
+# Parsed scores are cached per report, keyed on file name, mtime and size.
+# Bump the version whenever extraction changes so stale entries are dropped.
+_CACHE_NAME = ".scores_cache.json"
+_CACHE_VERSION = 2
+
+# Report file names: concept_a_seed42.html -> ("a", "42")
+_REPORT_NAME_RE = re.compile(r"concept_([^_]+)_seed([^_]*)\.html")
+
+
+def _load_score_cache(data_dir: Path) -> dict:
+    """Read cached per-file scores, or an empty cache if missing or outdated."""
+    try:
+        cache = json.loads((data_dir / _CACHE_NAME).read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("version") != _CACHE_VERSION:
+        return {}
+    files = cache.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def _cache_entry_matches(entry, st: os.stat_result) -> bool:
+    """True if a cache entry is well formed and recorded for this exact file state."""
+    return (
+        isinstance(entry, dict)
+        and isinstance(entry.get("scores"), dict)
+        and entry.get("mtime_ns") == st.st_mtime_ns
+        and entry.get("size") == st.st_size
+    )
+
+
+def _save_score_cache(data_dir: Path, files: dict) -> None:
+    """Write per-file scores back; a read-only data dir just skips caching."""
+    try:
+        (data_dir / _CACHE_NAME).write_text(json.dumps({"version": _CACHE_VERSION, "files": files}))
+    except OSError:
+        pass
+
+
 def load_synthetic_data(data_dir: Path) -> dict:
     """Load all synthetic runs, grouped by concept."""
+    reports = []
+    with os.scandir(data_dir) as it:
+        for entry in it:
+            m = _REPORT_NAME_RE.fullmatch(entry.name)
+            if m and entry.is_file():
+                reports.append((entry.name, m.group(1), m.group(2), entry.stat()))
+    reports.sort()
+    cached = _load_score_cache(data_dir)
+
+    all_scores = []
+    stale = []
+    fresh = {}
+    for name, _, _, st in reports:
+        entry = cached.get(name)
+        if _cache_entry_matches(entry, st):
+            all_scores.append(dict(entry["scores"]))
+        else:
+            all_scores.append(None)
+            stale.append(len(all_scores) - 1)
+            entry = {"mtime_ns": st.st_mtime_ns, "size": st.st_size}
+        fresh[name] = entry
+
+    if stale:
+        # Reports are small, so file reads dominate and threads overlap them
+        # without the fork-and-pickle cost of a process pool.
+        with ThreadPoolExecutor() as pool:
+            parsed = pool.map(extract_scores_from_html, [data_dir / reports[i][0] for i in stale])
+            for i, scores in zip(stale, parsed):
+                all_scores[i] = scores
+                fresh[reports[i][0]]["scores"] = dict(scores)
+
+    if stale or fresh.keys() != cached.keys():
+        _save_score_cache(data_dir, fresh)
+
     concepts = {}
-    for html_file in sorted(data_dir.glob("concept_*_seed*.html")):
-        # Parse filename: concept_a_seed42.html
-        parts = html_file.stem.split("_")
-        concept_key = parts[1]  # a, b, c
-        seed = parts[2].replace("seed", "")
-        
-        scores = extract_scores_from_html(html_file)
+    for (name, concept_key, seed, _), scores in zip(reports, all_scores):
         scores['seed'] = seed
-        scores['file'] = html_file.name
+        scores['file'] = name
         
         concepts.setdefault(concept_key, []).append(scores)
     
@@ -84,51 +206,76 @@ def load_synthetic_data(data_dir: Path) -> dict:
 
 def aggregate_synthetic(runs: list[dict]) -> dict:
     """Average scores across multiple runs of the same concept."""
-    metrics = ["purchase_intent", "overall_appeal", "uniqueness", "relevance", "believability", "value_perception", "excitement_score"]
+    metrics = METRICS + ["excitement_score"]
+    # One (runs, metrics) matrix with NaN where a run lacks a metric
+    mat = np.array([[r.get(metric, np.nan) for metric in metrics] for r in runs], dtype=float)
+    mat = mat.reshape(len(runs), len(metrics))
+    present = ~np.isnan(mat)
+    counts = present.sum(axis=0)
+    safe_counts = np.where(counts > 0, counts, 1)
+    means = np.where(present, mat, 0.0).sum(axis=0) / safe_counts
+    stds = np.sqrt(np.where(present, (mat - means) ** 2, 0.0).sum(axis=0) / safe_counts)
+
     agg = {}
-    for metric in metrics:
-        values = [r[metric] for r in runs if metric in r]
-        if values:
-            agg[metric] = np.mean(values)
-            agg[f"{metric}_std"] = np.std(values)
+    for j, metric in enumerate(metrics):
+        if counts[j]:
+            agg[metric] = means[j]
+            agg[f"{metric}_std"] = stds[j]
     return agg
 
 
 # ─── Human Data Processing ───────────────────────────────────────────────────
 
+# Survey field suffixes, in the same order as METRICS
+HUMAN_METRICS = ["purchase", "appeal", "unique", "relevant", "believe", "value"]
+
+# Response field names per concept: (rating keys, likes key, concerns key)
+_HUMAN_KEYS = tuple(
+    (concept, tuple(f"{concept}_{metric}" for metric in HUMAN_METRICS), f"{concept}_likes", f"{concept}_concerns")
+    for concept in ("a", "b", "c")
+)
+
+
+def _parse_rating(val) -> int:
+    """Parse one 1-5 Likert answer, returning -1 for missing, unparseable or out-of-range values."""
+    if type(val) is not int:  # ints are the usual case for JSON exports
+        if val is None:
+            return -1
+        try:
+            val = int(val)
+        except (ValueError, TypeError):
+            return -1
+    return val if 1 <= val <= 5 else -1
+
+
 def parse_human_responses(responses: list[dict]) -> dict:
     """Parse human survey responses into per-concept scores."""
     # Filter out attention check failures
     valid = [r for r in responses if r.get("attention") == "agree"]
     failed = len(responses) - len(valid)
     
-    concepts = {
-        "a": {"purchase": [], "appeal": [], "unique": [], "relevant": [], "believe": [], "value": [], "likes": [], "concerns": []},
-        "b": {"purchase": [], "appeal": [], "unique": [], "relevant": [], "believe": [], "value": [], "likes": [], "concerns": []},
-        "c": {"purchase": [], "appeal": [], "unique": [], "relevant": [], "believe": [], "value": [], "likes": [], "concerns": []},
-    }
+    concepts = {concept: {"likes": [], "concerns": []} for concept, *_ in _HUMAN_KEYS}
+    # Ratings are gathered flat per concept and converted to int16 in one call
+    ratings = {concept: [] for concept in concepts}
     
-    demographics = {"age": [], "gender": [], "income": [], "country": []}
-    rankings = {"rank_1": [], "rank_2": [], "rank_3": [], "recommend": []}
+    # Tallied as we go; Counters keep first-seen order, so ties break as before
+    demographics = {key: Counter() for key in ("age", "gender", "income", "country")}
+    rankings = {key: Counter() for key in ("rank_1", "rank_2", "rank_3", "recommend")}
     
     for r in valid:
-        for concept in ["a", "b", "c"]:
-            for metric in ["purchase", "appeal", "unique", "relevant", "believe", "value"]:
-                key = f"{concept}_{metric}"
-                val = r.get(key)
-                if val is not None:
-                    try:
-                        concepts[concept][metric].append(int(val))
-                    except (ValueError, TypeError):
-                        pass
+        for concept, rating_keys, likes_key, concerns_key in _HUMAN_KEYS:
+            ratings[concept].extend(map(_parse_rating, map(r.get, rating_keys)))
             
-            concepts[concept]["likes"].append(r.get(f"{concept}_likes", ""))
-            concepts[concept]["concerns"].append(r.get(f"{concept}_concerns", ""))
+            concepts[concept]["likes"].append(r.get(likes_key, ""))
+            concepts[concept]["concerns"].append(r.get(concerns_key, ""))
         
-        for demo_key in demographics:
-            demographics[demo_key].append(r.get(demo_key, ""))
-        for rank_key in rankings:
-            rankings[rank_key].append(r.get(rank_key, ""))
+        for demo_key, counts in demographics.items():
+            counts[r.get(demo_key, "")] += 1
+        for rank_key, counts in rankings.items():
+            counts[r.get(rank_key, "")] += 1
+
+    for concept, values in ratings.items():
+        concepts[concept]["mat"] = np.array(values, dtype=np.int16).reshape(len(valid), len(HUMAN_METRICS))
     
     return {
         "concepts": concepts,
@@ -142,44 +289,30 @@ def parse_human_responses(responses: list[dict]) -> dict:
 
 def human_concept_scores(concept_data: dict) -> dict:
     """Convert raw human responses to comparable scores."""
-    metrics_map = {
-        "purchase": "purchase_intent",
-        "appeal": "overall_appeal",
-        "unique": "uniqueness",
-        "relevant": "relevance",
-        "believe": "believability",
-        "value": "value_perception",
-    }
+    mat = concept_data["mat"]
+    mask = mat >= 0
+    counts = mask.sum(axis=0)
+    answered = counts > 0
+    safe_counts = np.where(answered, counts, 1)
+    means = np.where(mask, mat, 0).sum(axis=0) / safe_counts
+    variances = np.where(mask, (mat - means) ** 2, 0.0).sum(axis=0) / safe_counts
+    # Top-2-box: % scoring 4 or 5
+    t2b = ((mat >= 4) & mask).sum(axis=0) / safe_counts
     
     scores = {}
-    for short_name, long_name in metrics_map.items():
-        values = concept_data[short_name]
-        if values:
-            arr = np.array(values, dtype=float)
-            scores[long_name] = np.mean(arr) / 5.0  # Normalize to 0-1
-            scores[f"{long_name}_std"] = np.std(arr) / 5.0
-            scores[f"{long_name}_n"] = len(values)
-            # Top-2-box: % scoring 4 or 5
-            scores[f"{long_name}_t2b"] = np.mean(arr >= 4)
+    for j, long_name in enumerate(METRICS):
+        if answered[j]:
+            scores[long_name] = means[j] / 5.0  # Normalize to 0-1
+            scores[f"{long_name}_std"] = np.sqrt(variances[j]) / 5.0
+            scores[f"{long_name}_n"] = int(counts[j])
+            scores[f"{long_name}_t2b"] = t2b[j]
     
     return scores
 
 
 # ─── Comparison & Correlation ────────────────────────────────────────────────
 
-def pearson_correlation(x: list[float], y: list[float]) -> tuple[float, str]:
-    """Calculate Pearson r and interpret it."""
-    if len(x) < 3:
-        return float("nan"), "insufficient data (need 3+ concepts)"
-    
-    x_arr = np.array(x)
-    y_arr = np.array(y)
-    
-    if np.std(x_arr) == 0 or np.std(y_arr) == 0:
-        return float("nan"), "no variance"
-    
-    r = np.corrcoef(x_arr, y_arr)[0, 1]
-    
+def _interpret_correlation(r: float) -> tuple[float, str]:
     if r >= 0.90:
         interp = "exceptional"
     elif r >= 0.80:
@@ -191,7 +324,26 @@ def pearson_correlation(x: list[float], y: list[float]) -> tuple[float, str]:
     else:
         interp = "weak"
     
-    return float(r), interp
+    return r, interp
+
+
+def pearson_correlations(synthetic: np.ndarray, human: np.ndarray) -> list[tuple[float, str]]:
+    """Row-wise Pearson r, with its interpretation, for (metrics, concepts) matrices."""
+    if synthetic.shape[1] < 3:
+        return [(float("nan"), "insufficient data (need 3+ concepts)")] * synthetic.shape[0]
+
+    s_c = synthetic - synthetic.mean(axis=1, keepdims=True)
+    h_c = human - human.mean(axis=1, keepdims=True)
+    norms = np.linalg.norm(s_c, axis=1) * np.linalg.norm(h_c, axis=1)
+    dots = np.einsum("ij,ij->i", s_c, h_c)
+
+    results = []
+    for dot, norm in zip(dots.tolist(), norms.tolist()):
+        if norm == 0:
+            results.append((float("nan"), "no variance"))
+        else:
+            results.append(_interpret_correlation(dot / norm))
+    return results
 
 
 def rank_agreement(synthetic_order: list[str], human_order: list[str]) -> tuple[float, str]:
@@ -199,20 +351,16 @@ def rank_agreement(synthetic_order: list[str], human_order: list[str]) -> tuple[
     if synthetic_order == human_order:
         return 1.0, "perfect agreement"
     
-    # Count concordant pairs
+    # Count concordant pairs; a precedes b in synthetic_order, so a pair agrees
+    # exactly when a also ranks ahead of b for humans
+    h_rank = {c: i for i, c in enumerate(human_order)}
     concordant = 0
     discordant = 0
-    n = len(synthetic_order)
-    for i in range(n):
-        for j in range(i + 1, n):
-            s_i = synthetic_order.index(synthetic_order[i])
-            s_j = synthetic_order.index(synthetic_order[j])
-            h_i = human_order.index(synthetic_order[i])
-            h_j = human_order.index(synthetic_order[j])
-            if (s_i - s_j) * (h_i - h_j) > 0:
-                concordant += 1
-            else:
-                discordant += 1
+    for a, b in combinations(synthetic_order, 2):
+        if h_rank[a] < h_rank[b]:
+            concordant += 1
+        else:
+            discordant += 1
     
     tau = (concordant - discordant) / (concordant + discordant) if (concordant + discordant) > 0 else 0
     
@@ -238,7 +386,7 @@ def generate_report(synthetic: dict, human: dict, output_path: Path) -> None:
     # Demographics summary
     lines.append("## Human Panel Demographics\n")
     for key in ["age", "gender", "country"]:
-        counts = Counter(human["demographics"][key])
+        counts = human["demographics"][key]
         total = sum(counts.values())
         dist = ", ".join(f"{k}: {v} ({v/total:.0%})" for k, v in counts.most_common(6))
         lines.append(f"**{key.title()}:** {dist}")
@@ -246,14 +394,15 @@ def generate_report(synthetic: dict, human: dict, output_path: Path) -> None:
     
     # Per-concept comparison
     concept_names = {"a": "Wearable AI Pin", "b": "Premium Dog Meal Kit", "c": "Walk-to-Earn App"}
-    metrics = ["purchase_intent", "overall_appeal", "uniqueness", "relevance", "believability", "value_perception"]
+    metrics = METRICS
     
-    all_synthetic_values = {m: [] for m in metrics}
-    all_human_values = {m: [] for m in metrics}
+    # (concepts, metrics) score matrices, NaN where a side has no data
+    synthetic_matrix = np.full((len(concept_names), len(metrics)), np.nan)
+    human_matrix = np.full((len(concept_names), len(metrics)), np.nan)
     
     lines.append("## Per-Concept Comparison\n")
     
-    for concept_key, concept_name in concept_names.items():
+    for ci, (concept_key, concept_name) in enumerate(concept_names.items()):
         lines.append(f"### {concept_name}\n")
         lines.append(f"| Metric | Synthetic (mean±std) | Human (mean±std) | Δ | Human T2B |")
         lines.append(f"|--------|---------------------|-----------------|---|-----------|")
@@ -261,17 +410,17 @@ def generate_report(synthetic: dict, human: dict, output_path: Path) -> None:
         synth_runs = synthetic.get(concept_key, [])
         synth_agg = aggregate_synthetic(synth_runs) if synth_runs else {}
         human_scores = human_concept_scores(human["concepts"][concept_key])
+        synthetic_matrix[ci] = [synth_agg.get(metric, np.nan) for metric in metrics]
+        human_matrix[ci] = [human_scores.get(metric, np.nan) for metric in metrics]
+        deltas = np.abs(synthetic_matrix[ci] - human_matrix[ci])
         
-        for metric in metrics:
-            s_val = synth_agg.get(metric, float("nan"))
+        for j, metric in enumerate(metrics):
+            s_val = synthetic_matrix[ci, j]
             s_std = synth_agg.get(f"{metric}_std", 0)
-            h_val = human_scores.get(metric, float("nan"))
+            h_val = human_matrix[ci, j]
             h_std = human_scores.get(f"{metric}_std", 0)
             h_t2b = human_scores.get(f"{metric}_t2b", float("nan"))
-            delta = abs(s_val - h_val) if not (np.isnan(s_val) or np.isnan(h_val)) else float("nan")
-            
-            all_synthetic_values[metric].append(s_val)
-            all_human_values[metric].append(h_val)
+            delta = deltas[j]
             
             lines.append(
                 f"| {metric.replace('_', ' ').title()} "
@@ -288,10 +437,7 @@ def generate_report(synthetic: dict, human: dict, output_path: Path) -> None:
     lines.append("|--------|-----------|----------------|")
     
     correlations = []
-    for metric in metrics:
-        s_vals = all_synthetic_values[metric]
-        h_vals = all_human_values[metric]
-        r, interp = pearson_correlation(s_vals, h_vals)
+    for metric, (r, interp) in zip(metrics, pearson_correlations(synthetic_matrix.T, human_matrix.T)):
         correlations.append(r)
         lines.append(f"| {metric.replace('_', ' ').title()} | {r:.3f} | {interp} |")
     
@@ -316,11 +462,11 @@ def generate_report(synthetic: dict, human: dict, output_path: Path) -> None:
     lines.append("\n## Concept Ranking Comparison\n")
     
     # Human ranking from survey
-    rank_counts = Counter(human["rankings"]["rank_1"])
-    human_rank_1 = rank_counts.most_common(1)[0][0] if rank_counts else "unknown"
+    rank_counts = human["rankings"]["rank_1"]
+    human_rank_1 = max(rank_counts, key=rank_counts.get, default="unknown")
     
-    recommend_counts = Counter(human["rankings"]["recommend"])
-    human_recommend = recommend_counts.most_common(1)[0][0] if recommend_counts else "unknown"
+    recommend_counts = human["rankings"]["recommend"]
+    human_recommend = max(recommend_counts, key=recommend_counts.get, default="unknown")
     
     lines.append(f"**Human most appealing:** {human_rank_1}")
     lines.append(f"**Human most recommended:** {human_recommend}")
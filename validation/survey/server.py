@@ -1,16 +1,86 @@
 """Minimal survey collection server. Stores responses as JSON files."""
 import json
+import math
 import os
+import threading
 import uuid
 from datetime import datetime, timezone
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional; falls back to compact stdlib json
+    orjson = None
+
 DATA_DIR = Path(__file__).parent.parent / "data" / "human_responses"
-DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 SURVEY_DIR = Path(__file__).parent
 
+# Submission count: one b"1\n" record per response, appended atomically, with
+# an in-memory copy so requests never re-read the file. Opened by main().
+_COUNT_LOG = DATA_DIR / "_count.log"
+_COUNT_FD = -1
+_COUNT_LOCK = threading.Lock()
+_count = 0
+
+
+def _legacy_count() -> int:
+    """Count from before the append log: the old _count.txt, else the saved responses."""
+    try:
+        return int((DATA_DIR / "_count.txt").read_text().strip())
+    except (OSError, ValueError):
+        return sum(1 for _ in DATA_DIR.glob("*.json"))
+
+
+def _open_count_log() -> int:
+    """Open the count log for appending, seeding a new log from the legacy count."""
+    if _COUNT_LOG.exists():
+        return os.open(_COUNT_LOG, os.O_WRONLY | os.O_APPEND)
+    fd = os.open(_COUNT_LOG, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    seed = _legacy_count()
+    if seed > 0:
+        os.write(fd, b"1\n" * seed)
+    return fd
+
+
+def _init_storage() -> None:
+    """Create the response directory and load the submission count."""
+    global _COUNT_FD, _count
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    _COUNT_FD = _open_count_log()
+    _count = os.fstat(_COUNT_FD).st_size // 2
+
+
+def _has_non_finite(obj) -> bool:
+    """True if obj contains a NaN or infinite float (orjson writes those as null)."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(v) for v in obj.values())
+    if isinstance(obj, list):
+        return any(_has_non_finite(v) for v in obj)
+    return False
+
+
+def _dumps(obj) -> bytes:
+    """Serialize compactly, with orjson when it gives the same output as json."""
+    if orjson is not None and not _has_non_finite(obj):
+        try:
+            return orjson.dumps(obj)
+        except orjson.JSONEncodeError:  # e.g. integers wider than 64 bits
+            pass
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _record_submission() -> int:
+    """Append one submission to the count log and return the new total."""
+    global _count
+    with _COUNT_LOCK:
+        os.write(_COUNT_FD, b"1\n")
+        _count += 1
+        return _count
+
 
 class SurveyHandler(SimpleHTTPRequestHandler):
     def __init__(self, *args, **kwargs):
@@ -27,24 +97,20 @@ class SurveyHandler(SimpleHTTPRequestHandler):
                 data["_ip"] = self.client_address[0]
 
                 fname = DATA_DIR / f"{data['_id']}.json"
-                fname.write_text(json.dumps(data, indent=2))
+                fname.write_bytes(_dumps(data))
 
-                # Update count
-                count_file = DATA_DIR / "_count.txt"
-                count = int(count_file.read_text().strip()) if count_file.exists() else 0
-                count += 1
-                count_file.write_text(str(count))
+                count = _record_submission()
 
                 self.send_response(200)
                 self.send_header("Content-Type", "application/json")
                 self.send_header("Access-Control-Allow-Origin", "*")
                 self.end_headers()
-                self.wfile.write(json.dumps({"ok": True, "id": data["_id"], "count": count}).encode())
+                self.wfile.write(_dumps({"ok": True, "id": data["_id"], "count": count}))
             except Exception as e:
                 self.send_response(500)
                 self.send_header("Content-Type", "application/json")
                 self.end_headers()
-                self.wfile.write(json.dumps({"ok": False, "error": str(e)}).encode())
+                self.wfile.write(_dumps({"ok": False, "error": str(e)}))
         else:
             self.send_response(404)
             self.end_headers()
@@ -62,9 +128,14 @@ class SurveyHandler(SimpleHTTPRequestHandler):
             super().log_message(format, *args)
 
 
-if __name__ == "__main__":
+def main() -> None:
+    _init_storage()
     port = int(os.environ.get("PORT", 8090))
-    server = HTTPServer(("0.0.0.0", port), SurveyHandler)
+    server = ThreadingHTTPServer(("0.0.0.0", port), SurveyHandler)
     print(f"Survey server running on http://0.0.0.0:{port}")
     print(f"Responses saved to {DATA_DIR}")
     server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()